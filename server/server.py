@@ -21,7 +21,6 @@ from mcp.server.models import InitializationOptions
 # Use absolute imports from the new organized structure
 from src.mcp_mikrotik import MikroTikClient
 from src.mcp_mikrotik.models import MikroTikConfig
-from src.mcp_mikrotik.logs.models import is_valid_get_logs_args
 
 # Load environment variables from .env file (non-fatal; actual config is read at runtime)
 load_dotenv()
@@ -36,11 +35,12 @@ def load_mikrotik_config() -> MikroTikConfig:
     Raises:
         ValueError: If required configuration is missing
     """
+    port = os.environ.get("MIKROTIK_PORT")
     config = {
         "host": os.environ.get("MIKROTIK_HOST", "192.168.88.1"),
         "username": os.environ.get("MIKROTIK_USERNAME", "admin"),
         "password": os.environ.get("MIKROTIK_PASSWORD", ""),
-        "port": int(os.environ.get("MIKROTIK_PORT")) if os.environ.get("MIKROTIK_PORT") else None,
+        "port": int(port) if port else None,
         "useSSL": os.environ.get("MIKROTIK_USE_SSL", "false").lower() == "true",
     }
     
@@ -85,8 +85,8 @@ async def server_lifespan(server: Server) -> AsyncIterator[Dict[str, Any]]:
         yield {"mikrotik_client": mikrotik_client}
     finally:
         # Clean up on shutdown
-        # Note: MikroTik client doesn't require explicit cleanup
-        pass
+        if mikrotik_client is not None:
+            await mikrotik_client.close()
 
 
 # Note: Lifespan is handled in the run() function
@@ -490,9 +490,7 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[Union[t
     
     try:
         if name == "get_logs":
-            if not is_valid_get_logs_args(arguments):
-                raise ValueError("Invalid arguments for get_logs tool")
-            
+            # Arguments were already validated against the tool's inputSchema by call_tool()
             logs = await mikrotik_client.get_logs(arguments)
             return [types.TextContent(type="text", text=json.dumps(logs, indent=2))]
         
@@ -13,8 +13,6 @@ from .system import MikroTikSystemClient
 from .ip import MikroTikIPClient
 from .interface import MikroTikInterfaceClient
 from .firewall import MikroTikFirewallClient
-from .wireless import MikroTikWirelessClient
-from .routing import MikroTikRoutingClient
 from .dhcp import MikroTikDHCPClient
 from .models import MikroTikConfig
 
@@ -32,3 +30,14 @@ __all__ = [
     "MikroTikDHCPClient",
     "MikroTikConfig"
 ]
+
+
+def __getattr__(name):
+    # The routing and wireless clients are imported on first use, like their subpackages
+    if name == "MikroTikWirelessClient":
+        from .wireless.client import MikroTikWirelessClient
+        return MikroTikWirelessClient
+    if name == "MikroTikRoutingClient":
+        from .routing.client import MikroTikRoutingClient
+        return MikroTikRoutingClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
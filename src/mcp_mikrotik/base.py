@@ -3,14 +3,141 @@ MikroTik Base Client
 
 This module provides the base client class that all specialized MikroTik clients inherit from.
 It handles common functionality like authentication, HTTP requests, and logging.
+Requests go through a non-blocking aiohttp session, so concurrent calls overlap.
 """
+import asyncio
+import base64
+import functools
 import json
-from typing import Dict, List, Optional, Any, Union
-import requests
-from requests.auth import HTTPBasicAuth
+import time
+import weakref
+from typing import Any, AsyncIterator, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import aiohttp
 
 from .models import MikroTikConfig
 
+# Optional speedups: orjson or msgspec parse JSON in C and are noticeably faster
+# than the stdlib parser on large print responses (e.g. /log/print).
+try:
+    import orjson
+    
+    _json_decode = orjson.loads
+    _JSON_DECODE_ERRORS: tuple = (ValueError,)  # orjson.JSONDecodeError is a ValueError
+except ImportError:
+    try:
+        import msgspec
+        
+        _json_decode = msgspec.json.decode
+        _JSON_DECODE_ERRORS = (ValueError, msgspec.DecodeError)
+    except ImportError:
+        _json_decode = json.loads
+        _JSON_DECODE_ERRORS = (ValueError,)
+
+try:
+    # Optional: incremental JSON parsing, lets large print responses be consumed as they arrive
+    import ijson as _ijson
+except ImportError:
+    _ijson = None
+
+
+# Errors a request can end in: transport failures, HTTP error statuses and bad response data
+TRANSPORT_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, ValueError, TypeError)
+
+
+def log_and_reraise(action: str) -> Callable:
+    """
+    Decorate an async client method to log request errors before re-raising them.
+    
+    This is the one place request errors are logged: _make_request and _print
+    only raise, and every public getter of the specialized clients carries
+    this decorator.
+    
+    Args:
+        action: What the method does, used in the message ("Error <action>: ...")
+    """
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            try:
+                return await method(self, *args, **kwargs)
+            except TRANSPORT_ERRORS as e:
+                self._log_error(f"Error {action}: {str(e)}")
+                raise
+        return wrapper
+    return decorator
+
+
+# A connector, or a zero-argument callable creating one once an event loop is running
+ConnectorSource = Optional[Union[aiohttp.BaseConnector, Callable[[], aiohttp.BaseConnector]]]
+
+# RouterOS serves the REST API from a small web server; keep per-device concurrency modest
+MAX_CONNECTIONS_PER_HOST = 8
+KEEPALIVE_TIMEOUT = 30
+
+
+# Per event loop, one semaphore per device (base URL), shared by every client talking to it
+_DEVICE_SEMAPHORES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def new_connector() -> aiohttp.TCPConnector:
+    """
+    Create a keep-alive connection pool for talking to RouterOS devices.
+    
+    Must be called while an event loop is running.
+    """
+    return aiohttp.TCPConnector(
+        limit_per_host=MAX_CONNECTIONS_PER_HOST,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+    )
+
+
+def make_request_body_builder(mappings: Mapping[str, str], doc: Optional[str] = None,
+                              skip_empty: Sequence[str] = ()) -> Callable[[Any, Mapping[str, Any]], Dict[str, Any]]:
+    """
+    Create a ``_build_*_request_body`` method for a fixed option mapping.
+    
+    The mapping is bound once when the client class is defined, and the
+    generated method only walks the options that were actually supplied.
+    
+    Args:
+        mappings: Option name -> API parameter name
+        doc: Docstring for the generated method
+        skip_empty: Options also left out when falsy (e.g. an empty string
+            filter), not just when None
+        
+    Returns:
+        Method taking (self, options) and returning the request body
+    """
+    skip_empty = frozenset(skip_empty)
+    
+    def build_request_body(self, options: Mapping[str, Any]) -> Dict[str, Any]:
+        if not options:
+            return {}
+        return {mappings[key]: value for key, value in options.items()
+                if value is not None and key in mappings and (value or key not in skip_empty)}
+    
+    build_request_body.__doc__ = doc
+    return build_request_body
+
+
+class _PrefixedReader:
+    """Async file-like reader returning already read bytes before the rest of a stream."""
+    
+    def __init__(self, head: bytes, stream: aiohttp.StreamReader):
+        self._head = head
+        self._stream = stream
+    
+    async def read(self, size: int = -1) -> bytes:
+        if self._head:
+            if size < 0:
+                size = len(self._head)
+            data, self._head = self._head[:size], self._head[size:]
+            return data
+        return await self._stream.read(size)
+
 
 class MikroTikBaseClient:
     """
@@ -20,27 +147,79 @@ class MikroTikBaseClient:
     including authentication, HTTP request handling, and logging.
     """
     
-    def __init__(self, config: MikroTikConfig):
+    def __init__(self, config: MikroTikConfig, connector: ConnectorSource = None,
+                 max_concurrent_requests: int = MAX_CONNECTIONS_PER_HOST):
         """
         Initialize the MikroTik API client.
         
         Args:
             config: Configuration for the MikroTik API connection
+            connector: Optional shared connection pool, or a callable returning one.
+                A shared connector is not closed by this client; without one the
+                client owns a private pool.
+            max_concurrent_requests: Cap on in-flight requests to the device, shared
+                by all clients of the same device (the first client to send a
+                request sets the limit)
         """
         self.config = config
+        self.max_concurrent_requests = max_concurrent_requests
         protocol = "https" if config.get("useSSL", False) else "http"
         port = config.get("port") or (443 if config.get("useSSL", False) else 80)
         
         self.base_url = f"{protocol}://{config['host']}:{port}/rest"
-        self.auth = HTTPBasicAuth(config['username'], config['password'])
-        self.session = requests.Session()
-        self.session.auth = self.auth
-        self.session.headers.update({
+        credentials = f"{config['username']}:{config['password']}".encode('utf-8')
+        self.headers = {
+            "Authorization": f"Basic {base64.b64encode(credentials).decode('ascii')}",
             "Content-Type": "application/json",
-        })
-        self.session.timeout = 30  # 30 seconds timeout
+        }
+        self.timeout = aiohttp.ClientTimeout(total=30)  # 30 seconds timeout
+        
+        # Created lazily on first request, since aiohttp needs a running event loop
+        self._connector = connector
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # TTL cache for rarely-changing data: (method, endpoint, body) -> (expires_at, response).
+        # The cache is per client, and each client talks to a single device.
+        self._cache: Dict[Tuple[str, str, Tuple[Tuple[str, Any], ...]], Tuple[float, Any]] = {}
+        self._cache_locks: Dict[Tuple[str, str, Tuple[Tuple[str, Any], ...]], asyncio.Lock] = {}
+        
+        # In-flight print requests, keyed by (endpoint, body), shared by concurrent callers
+        self._inflight: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], "asyncio.Future[List[Dict[str, Any]]]"] = {}
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the client's HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            connector = self._connector() if callable(self._connector) else self._connector
+            self._session = aiohttp.ClientSession(
+                connector=connector or new_connector(),
+                connector_owner=connector is None,
+                headers=self.headers,
+                timeout=self.timeout,
+            )
+        return self._session
+    
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return the semaphore limiting concurrent requests to this client's device."""
+        semaphores = _DEVICE_SEMAPHORES.setdefault(asyncio.get_running_loop(), {})
+        semaphore = semaphores.get(self.base_url)
+        if semaphore is None:
+            semaphore = semaphores[self.base_url] = asyncio.Semaphore(self.max_concurrent_requests)
+        return semaphore
     
-    def _make_request(self, method: str, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Any:
+    async def close(self) -> None:
+        """Close the underlying HTTP session, if one was opened."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+    
+    async def _make_request(self, method: str, endpoint: str, data: Optional[Dict[str, Any]] = None,
+                            stream: bool = False) -> Any:
         """
         Make a request to the MikroTik API.
         
@@ -48,66 +227,254 @@ class MikroTikBaseClient:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint
             data: Request data
+            stream: Return an async iterator over the items of the top-level
+                JSON array instead of the parsed body. Only honoured when ijson
+                is installed; otherwise the parsed body is returned as usual.
             
         Returns:
             Response data
             
         Raises:
-            requests.ConnectionError: If there's a connection error
-            requests.Timeout: If the request times out
-            requests.HTTPError: If the API returns an HTTP error status
-            requests.RequestException: For other request-related errors
+            aiohttp.ClientConnectionError: If there's a connection error
+            asyncio.TimeoutError: If the request times out
+            aiohttp.ClientResponseError: If the API returns an HTTP error status
+            aiohttp.ClientError: For other request-related errors
             ValueError: For unsupported HTTP methods or invalid response data
-            json.JSONDecodeError: If the response cannot be parsed as JSON
         """
+        request_kwargs = self._request_kwargs(method, data)
+        if stream and _ijson is not None:
+            return self._stream_request(method, endpoint, request_kwargs)
+        
         url = f"{self.base_url}{endpoint}"
         
         self._log_info(f"Request: {method} {endpoint}")
         
-        try:
-            if method.upper() == "GET":
-                response = self.session.get(url, params=data)
-            elif method.upper() == "POST":
-                response = self.session.post(url, json=data)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+        async with self._get_semaphore(), \
+                self._get_session().request(method.upper(), url, **request_kwargs) as response:
+            content = await response.read()
             
-            response.raise_for_status()
-            self._log_info(f"Response: {response.status_code} {response.reason}")
+            if response.status >= 400:
+                self._raise_http_error(response, content)
             
-            try:
-                return response.json()
-            except ValueError as e:
-                # Handle empty or invalid JSON response
-                if response.content:
-                    self._log_warning(f"Invalid JSON response: {response.content[:100]}...")
-                else:
-                    self._log_info("Empty response received")
-                raise ValueError(f"Failed to parse API response as JSON: {str(e)}")
+            self._log_info(f"Response: {response.status} {response.reason}")
+        
+        return self._decode_response(content)
+    
+    async def _stream_request(self, method: str, endpoint: str, request_kwargs: Dict[str, Any]) -> AsyncIterator[Any]:
+        """
+        Yield the items of a top-level JSON array response as they are parsed.
+        
+        Closing the iterator early aborts the response, so callers that have
+        seen enough don't pay for downloading the rest of it. Any other body
+        (e.g. the older {'ret': [...]} wrapper) is read and decoded in full,
+        then the items of its 'ret' list are yielded.
+        """
+        url = f"{self.base_url}{endpoint}"
+        
+        self._log_info(f"Request: {method} {endpoint} (streaming)")
+        
+        try:
+            async with self._get_semaphore(), \
+                    self._get_session().request(method.upper(), url, **request_kwargs) as response:
+                if response.status >= 400:
+                    self._raise_http_error(response, await response.read())
                 
-        except requests.ConnectionError as e:
-            self._log_error(f"Connection error: {str(e)}")
-            raise
-        except requests.Timeout as e:
-            self._log_error(f"Request timeout: {str(e)}")
-            raise
-        except requests.HTTPError as e:
-            status_code = e.response.status_code if hasattr(e, 'response') and e.response else 'unknown'
-            self._log_error(f"HTTP error {status_code}: {str(e)}")
-            
-            # Try to extract more detailed error information from the response
-            error_detail = ""
-            try:
-                if hasattr(e, 'response') and e.response and e.response.content:
-                    error_content = e.response.content.decode('utf-8', errors='replace')
-                    error_detail = f" - Details: {error_content[:200]}"
-            except Exception:
-                pass
+                self._log_info(f"Response: {response.status} {response.reason}")
+                
+                head = await self._read_head(response.content)
+                if head[:1] != b'[':
+                    body = self._decode_response(head + await response.content.read())
+                    if isinstance(body, dict) and isinstance(body.get('ret'), list):
+                        for item in body['ret']:
+                            yield item
+                    else:
+                        self._log_warning(f"Unexpected streamed response type: {type(body).__name__}")
+                    return
                 
-            raise requests.HTTPError(f"API request failed with status {status_code}{error_detail}", response=e.response if hasattr(e, 'response') else None)
-        except requests.RequestException as e:
-            self._log_error(f"Request error: {str(e)}")
-            raise
+                async for item in _ijson.items(_PrefixedReader(head, response.content), 'item', use_float=True):
+                    yield item
+                    
+        except _ijson.JSONError as e:
+            raise ValueError(f"Failed to parse API response as JSON: {str(e)}")
+    
+    @staticmethod
+    async def _read_head(content: aiohttp.StreamReader) -> bytes:
+        """Read a response up to its first non-whitespace byte, returning what was read from there on."""
+        head = b''
+        while not head:
+            chunk = await content.readany()
+            if not chunk:
+                break
+            head = chunk.lstrip()
+        return head
+    
+    def _decode_response(self, content: bytes) -> Any:
+        """Parse a JSON response body, raising ValueError if it is empty or invalid."""
+        try:
+            return _json_decode(content)
+        except _JSON_DECODE_ERRORS as e:
+            # Carry the start of the body in the error, the caller logs it once
+            body = f"{content[:100]!r}..." if content else "empty response"
+            raise ValueError(f"Failed to parse API response as JSON: {str(e)} ({body})")
+    
+    @staticmethod
+    def _request_kwargs(method: str, data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Return the aiohttp request arguments carrying ``data`` for the given method."""
+        if method.upper() == "GET":
+            return {"params": data}
+        elif method.upper() == "POST":
+            return {"json": data}
+        else:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+    
+    def _raise_http_error(self, response: aiohttp.ClientResponse, content: bytes) -> None:
+        """Raise an HTTP error status, including the device's error detail."""
+        # Include the device's error message, it usually explains what went wrong
+        error_detail = ""
+        if content:
+            error_detail = f" - Details: {content.decode('utf-8', errors='replace')[:200]}"
+        
+        raise aiohttp.ClientResponseError(
+            response.request_info,
+            response.history,
+            status=response.status,
+            message=f"API request failed with status {response.status}{error_detail}",
+            headers=response.headers,
+        )
+    
+    async def _cached_request(self, method: str, endpoint: str, data: Optional[Dict[str, Any]] = None,
+                              ttl: float = 10.0) -> Any:
+        """
+        Make a request, reusing a previous response for up to ``ttl`` seconds.
+        
+        Concurrent misses for the same request wait on a per-key lock, so only
+        one of them reaches the device. Errors are never cached. The cached
+        response object is shared between callers and must not be mutated.
+        
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint
+            data: Request data
+            ttl: Seconds a response stays valid
+            
+        Returns:
+            Response data
+        """
+        key = (method, endpoint, tuple(sorted(data.items())) if data else ())
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        
+        lock = self._cache_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another caller may have refreshed the entry while we waited
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+            
+            response = await self._make_request(method, endpoint, data)
+            now = time.monotonic()
+            self._evict_expired(now)
+            self._cache[key] = (now + ttl, response)
+            return response
+    
+    def _evict_expired(self, now: float) -> None:
+        """Drop expired cache entries, and the locks of keys no longer cached that nobody holds."""
+        for key in [key for key, (expires_at, _) in self._cache.items() if expires_at <= now]:
+            del self._cache[key]
+        self._drop_idle_locks()
+    
+    def _drop_idle_locks(self) -> None:
+        """Drop the cache locks of keys without a cache entry, unless a request holds them."""
+        for key in [key for key, lock in self._cache_locks.items()
+                    if key not in self._cache and not lock.locked()]:
+            del self._cache_locks[key]
+    
+    def invalidate(self, endpoint: Optional[str] = None) -> None:
+        """
+        Drop cached responses.
+        
+        Args:
+            endpoint: Only drop entries for endpoints under this menu path
+                (e.g. '/ip/pool'); drop everything if omitted
+        """
+        if endpoint is None:
+            self._cache.clear()
+        else:
+            for key in [key for key in self._cache if key[1].startswith(endpoint)]:
+                del self._cache[key]
+        self._drop_idle_locks()
+    
+    async def _print(self, endpoint: str, body: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Run a RouterOS print command and normalize the response to a list of records.
+        
+        Errors are raised unlogged; the public getters calling this log them
+        through log_and_reraise.
+        
+        Unfiltered prints are sent as a plain GET on the menu path, which
+        RouterOS answers with the full list and saves encoding an empty body.
+        
+        Identical prints issued concurrently share a single request: later
+        callers await the one already in flight instead of hitting the device
+        again, and all of them receive the same result list.
+        
+        Args:
+            endpoint: API endpoint of the print command (e.g. '/interface/print')
+            body: Optional request body with filters
+            
+        Returns:
+            List of records returned by the device
+            
+        Raises:
+            aiohttp.ClientError: For connection or API errors
+            ValueError: For invalid response data
+        """
+        key = (endpoint, tuple(sorted(body.items())) if body else ())
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._fetch_print(endpoint, body))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        
+        # Shield so one cancelled caller doesn't cancel the request for the others
+        return await asyncio.shield(future)
+    
+    async def _fetch_print(self, endpoint: str, body: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Issue a single print request; see _print for the public behaviour."""
+        if body:
+            response = await self._make_request('POST', endpoint, body)
+        else:
+            menu = endpoint[:-len('/print')] if endpoint.endswith('/print') else endpoint
+            response = await self._make_request('GET', menu)
+        
+        if isinstance(response, list):
+            return response
+        elif isinstance(response, dict) and 'ret' in response:
+            return response['ret']
+        else:
+            self._log_warning(f"Unexpected response format: {type(response)}")
+            return []
+    
+    @log_and_reraise("running batch")
+    async def batch(self, ops: Sequence[Tuple[str, Optional[Dict[str, Any]]]]) -> List[List[Dict[str, Any]]]:
+        """
+        Run several print commands concurrently over the client's HTTP session.
+        
+        RouterOS REST has no batch endpoint, so the commands are fanned out
+        in parallel instead of being sent one after another.
+        
+        Args:
+            ops: Sequence of (endpoint, body) pairs, body may be None
+            
+        Returns:
+            One list of records per operation, in the same order as ops
+            
+        Raises:
+            aiohttp.ClientError: If any of the requests fails
+            ValueError: For invalid response data
+        """
+        return list(await asyncio.gather(*(self._print(endpoint, body) for endpoint, body in ops)))
     
     def _log_info(self, message: str) -> None:
         """Log an informational message."""
@@ -134,7 +501,7 @@ class MikroTikBaseClient:
         """
         try:
             # Use a simple endpoint to test connectivity
-            self._make_request('POST', '/system/resource/print', {})
+            await self._make_request('POST', '/system/resource/print', {})
             return True
         except Exception as e:
             self._log_error(f"Connection test failed: {str(e)}")
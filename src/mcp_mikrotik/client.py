@@ -5,17 +5,39 @@ This module provides the main client that combines all specialized MikroTik clie
 It provides a unified interface for all MikroTik API operations.
 """
 
-from .base import MikroTikBaseClient
+from functools import cached_property
+
+from .base import MikroTikBaseClient, new_connector
 from .logs import MikroTikLogsClient
 from .system import MikroTikSystemClient
 from .ip import MikroTikIPClient
 from .interface import MikroTikInterfaceClient
 from .firewall import MikroTikFirewallClient
-from .wireless import MikroTikWirelessClient
-from .routing import MikroTikRoutingClient
 from .dhcp import MikroTikDHCPClient
 
 
+# Top-level method name -> attribute holding the specialized client that implements it
+_DELEGATES = {
+    'get_logs': 'logs',
+    'get_debug_logs': 'logs',
+    'get_error_logs': 'logs',
+    'get_warning_logs': 'logs',
+    'get_info_logs': 'logs',
+    'get_all_logs_partitioned': 'logs',
+    'get_logs_from_buffer': 'logs',
+    'get_logs_with_extra_info': 'logs',
+    'find_logs': 'logs',
+    'get_logs_by_condition': 'logs',
+    'get_system_info': 'system',
+    'get_system_resources': 'system',
+    'get_system_health': 'system',
+    'get_ip_addresses': 'ip',
+    'get_ip_routes': 'ip',
+    'get_ip_pools': 'ip',
+    'get_network_summary': 'ip',
+}
+
+
 class MikroTikClient(MikroTikBaseClient):
     """
     Main MikroTik client that combines all specialized clients.
@@ -26,80 +48,65 @@ class MikroTikClient(MikroTikBaseClient):
     
     def __init__(self, config):
         """Initialize the main client and all specialized clients."""
-        super().__init__(config)
+        # One connection pool is shared by all specialized clients, so their
+        # requests reuse the same keep-alive connections to the device
+        self._shared_connector = None
+        super().__init__(config, connector=self._get_shared_connector)
         
         # Initialize specialized clients
-        self.logs = MikroTikLogsClient(config)
-        self.system = MikroTikSystemClient(config)
-        self.ip = MikroTikIPClient(config)
-        self.interface = MikroTikInterfaceClient(config)
-        self.firewall = MikroTikFirewallClient(config)
-        self.wireless = MikroTikWirelessClient(config)
-        self.routing = MikroTikRoutingClient(config)
-        self.dhcp = MikroTikDHCPClient(config)
+        self.logs = MikroTikLogsClient(config, connector=self._get_shared_connector)
+        self.system = MikroTikSystemClient(config, connector=self._get_shared_connector)
+        self.ip = MikroTikIPClient(config, connector=self._get_shared_connector)
+        self.interface = MikroTikInterfaceClient(config, connector=self._get_shared_connector)
+        self.firewall = MikroTikFirewallClient(config, connector=self._get_shared_connector)
+        self.dhcp = MikroTikDHCPClient(config, connector=self._get_shared_connector)
+    
+    # The wireless and routing clients are not implemented yet, so they are
+    # only imported and created when first accessed
+    
+    @cached_property
+    def wireless(self):
+        """Specialized client for wireless management, created on first access."""
+        from .wireless.client import MikroTikWirelessClient
+        return MikroTikWirelessClient(self.config, connector=self._get_shared_connector)
+    
+    @cached_property
+    def routing(self):
+        """Specialized client for routing management, created on first access."""
+        from .routing.client import MikroTikRoutingClient
+        return MikroTikRoutingClient(self.config, connector=self._get_shared_connector)
+    
+    def _get_shared_connector(self):
+        """Return the connection pool shared by all clients, creating it on first use."""
+        if self._shared_connector is None or self._shared_connector.closed:
+            self._shared_connector = new_connector()
+        return self._shared_connector
+    
+    def _sub_clients(self):
+        """Return the specialized clients, leaving out lazy ones not created yet."""
+        lazy_clients = [vars(self)[name] for name in ('wireless', 'routing') if name in vars(self)]
+        return [self.logs, self.system, self.ip, self.interface, self.firewall, self.dhcp, *lazy_clients]
+    
+    def invalidate(self, endpoint=None):
+        """Drop cached responses of this client and all specialized clients, see MikroTikBaseClient.invalidate."""
+        super().invalidate(endpoint)
+        for client in self._sub_clients():
+            client.invalidate(endpoint)
+    
+    async def close(self):
+        """Close the HTTP sessions of this client and all specialized clients."""
+        for client in self._sub_clients():
+            await client.close()
+        await super().close()
+        if self._shared_connector is not None:
+            await self._shared_connector.close()
+            self._shared_connector = None
     
     # Delegate methods to specialized clients for backward compatibility
     
-    async def get_logs(self, options=None, max_logs=1000):
-        """Get system logs with optional filtering."""
-        return await self.logs.get_logs(options, max_logs)
-    
-    async def get_debug_logs(self, options=None, max_logs=1000):
-        """Get debug logs."""
-        return await self.logs.get_debug_logs(options, max_logs)
-    
-    async def get_error_logs(self, options=None, max_logs=1000):
-        """Get error logs."""
-        return await self.logs.get_error_logs(options, max_logs)
-    
-    async def get_warning_logs(self, options=None, max_logs=1000):
-        """Get warning logs."""
-        return await self.logs.get_warning_logs(options, max_logs)
-    
-    async def get_info_logs(self, options=None, max_logs=1000):
-        """Get info logs."""
-        return await self.logs.get_info_logs(options, max_logs)
-    
-    async def get_logs_from_buffer(self, buffer_name, options=None, max_logs=1000):
-        """Get logs from a specific buffer."""
-        return await self.logs.get_logs_from_buffer(buffer_name, options, max_logs)
-    
-    async def get_logs_with_extra_info(self, options=None, max_logs=1000):
-        """Get logs with extra info."""
-        return await self.logs.get_logs_with_extra_info(options, max_logs)
-    
-    async def find_logs(self, where, options=None):
-        """Find logs using client-side filtering."""
-        return await self.logs.find_logs(where, options)
-    
-    async def get_logs_by_condition(self, condition, options=None, max_logs=1000):
-        """Get logs filtered by a specific condition."""
-        return await self.logs.get_logs_by_condition(condition, options, max_logs)
-    
-    async def get_system_info(self):
-        """Get system information."""
-        return await self.system.get_system_info()
-    
-    async def get_system_resources(self):
-        """Get detailed system resource information."""
-        return await self.system.get_system_resources()
-    
-    async def get_system_health(self):
-        """Get system health information including resource usage."""
-        return await self.system.get_system_health()
-    
-    async def get_ip_addresses(self, options=None):
-        """Get IP addresses configured on the device."""
-        return await self.ip.get_ip_addresses(options)
-    
-    async def get_ip_routes(self, options=None):
-        """Get IP routes configured on the device."""
-        return await self.ip.get_ip_routes(options)
-    
-    async def get_ip_pools(self):
-        """Get IP pools configured on the device."""
-        return await self.ip.get_ip_pools()
-    
-    async def get_network_summary(self):
-        """Get a summary of network configuration."""
-        return await self.ip.get_network_summary()
+    def __getattr__(self, name):
+        """Resolve legacy top-level methods to the owning specialized client."""
+        sub_client = _DELEGATES.get(name)
+        if sub_client is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        return getattr(getattr(self, sub_client), name)
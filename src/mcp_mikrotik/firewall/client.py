@@ -5,9 +5,21 @@ This module provides a specialized client for MikroTik firewall management.
 """
 
 from typing import Dict, List, Optional, Any
-from ..base import MikroTikBaseClient
+from ..base import MikroTikBaseClient, log_and_reraise, make_request_body_builder
 from .models import MikroTikFirewallRule, GetFirewallRulesArgs
 
+# Map options to request body with proper API parameter names
+_FIREWALL_RULE_OPTION_MAPPINGS = {
+    'chain': 'chain',
+    'action': 'action',
+    'src_address': 'src-address',
+    'dst_address': 'dst-address',
+    'protocol': 'protocol',
+    'disabled': 'disabled',
+    'comment': 'comment'
+}
+
+
 class MikroTikFirewallClient(MikroTikBaseClient):
     """
     Specialized client for MikroTik firewall management.
@@ -15,6 +27,7 @@ class MikroTikFirewallClient(MikroTikBaseClient):
     Reference: MikroTik RouterOS API documentation for firewall management
     """
     
+    @log_and_reraise("fetching firewall rules")
     async def get_firewall_rules(self, options: Optional[GetFirewallRulesArgs] = None) -> List[MikroTikFirewallRule]:
         """
         Get firewall filter rules configured on the device.
@@ -30,25 +43,13 @@ class MikroTikFirewallClient(MikroTikBaseClient):
             List of firewall filter rules
             
         Raises:
-            requests.RequestException: For connection or API errors
+            aiohttp.ClientError: For connection or API errors
             ValueError: For invalid response data
         """
-        try:
-            request_body = self._build_firewall_rules_request_body(options or {})
-            response = self._make_request('POST', '/ip/firewall/filter/print', request_body)
-            
-            if isinstance(response, list):
-                return response
-            elif isinstance(response, dict) and 'ret' in response:
-                return response['ret']
-            else:
-                self._log_warning(f"Unexpected response format: {type(response)}")
-                return []
-                
-        except Exception as e:
-            self._log_error(f"Error fetching firewall rules: {str(e)}")
-            raise
+        request_body = self._build_firewall_rules_request_body(options or {})
+        return await self._print('/ip/firewall/filter/print', request_body)
     
+    @log_and_reraise("fetching NAT rules")
     async def get_nat_rules(self) -> List[MikroTikFirewallRule]:
         """
         Get NAT rules configured on the device.
@@ -60,24 +61,12 @@ class MikroTikFirewallClient(MikroTikBaseClient):
             List of NAT rules
             
         Raises:
-            requests.RequestException: For connection or API errors
+            aiohttp.ClientError: For connection or API errors
             ValueError: For invalid response data
         """
-        try:
-            response = self._make_request('POST', '/ip/firewall/nat/print', {})
-            
-            if isinstance(response, list):
-                return response
-            elif isinstance(response, dict) and 'ret' in response:
-                return response['ret']
-            else:
-                self._log_warning(f"Unexpected response format: {type(response)}")
-                return []
-                
-        except Exception as e:
-            self._log_error(f"Error fetching NAT rules: {str(e)}")
-            raise
+        return await self._print('/ip/firewall/nat/print')
     
+    @log_and_reraise("fetching mangle rules")
     async def get_mangle_rules(self) -> List[MikroTikFirewallRule]:
         """
         Get mangle rules configured on the device.
@@ -89,24 +78,12 @@ class MikroTikFirewallClient(MikroTikBaseClient):
             List of mangle rules
             
         Raises:
-            requests.RequestException: For connection or API errors
+            aiohttp.ClientError: For connection or API errors
             ValueError: For invalid response data
         """
-        try:
-            response = self._make_request('POST', '/ip/firewall/mangle/print', {})
-            
-            if isinstance(response, list):
-                return response
-            elif isinstance(response, dict) and 'ret' in response:
-                return response['ret']
-            else:
-                self._log_warning(f"Unexpected response format: {type(response)}")
-                return []
-                
-        except Exception as e:
-            self._log_error(f"Error fetching mangle rules: {str(e)}")
-            raise
+        return await self._print('/ip/firewall/mangle/print')
     
+    @log_and_reraise("fetching address lists")
     async def get_address_lists(self) -> List[Dict[str, Any]]:
         """
         Get address lists configured on the device.
@@ -118,49 +95,12 @@ class MikroTikFirewallClient(MikroTikBaseClient):
             List of address lists
             
         Raises:
-            requests.RequestException: For connection or API errors
+            aiohttp.ClientError: For connection or API errors
             ValueError: For invalid response data
         """
-        try:
-            response = self._make_request('POST', '/ip/firewall/address-list/print', {})
-            
-            if isinstance(response, list):
-                return response
-            elif isinstance(response, dict) and 'ret' in response:
-                return response['ret']
-            else:
-                self._log_warning(f"Unexpected response format: {type(response)}")
-                return []
-                
-        except Exception as e:
-            self._log_error(f"Error fetching address lists: {str(e)}")
-            raise
+        return await self._print('/ip/firewall/address-list/print')
     
-    def _build_firewall_rules_request_body(self, options: GetFirewallRulesArgs) -> Dict[str, Any]:
-        """
-        Build the request body for firewall rules API calls.
-        
-        Args:
-            options: Firewall rules filtering options
-            
-        Returns:
-            Request body dictionary
-        """
-        request_body = {}
-        
-        # Map options to request body with proper API parameter names
-        option_mappings = {
-            'chain': 'chain',
-            'action': 'action',
-            'src_address': 'src-address',
-            'dst_address': 'dst-address',
-            'protocol': 'protocol',
-            'disabled': 'disabled',
-            'comment': 'comment'
-        }
-        
-        for option_key, api_key in option_mappings.items():
-            if options.get(option_key) is not None:
-                request_body[api_key] = options[option_key]
-        
-        return request_body
+    _build_firewall_rules_request_body = make_request_body_builder(
+        _FIREWALL_RULE_OPTION_MAPPINGS,
+        "Build the request body for firewall rules API calls.",
+    )
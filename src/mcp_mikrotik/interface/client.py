@@ -4,10 +4,20 @@ MikroTik Interface Client
 This module provides a specialized client for MikroTik interface management.
 """
 
-from typing import Dict, List, Optional, Any
-from ..base import MikroTikBaseClient
+from typing import List, Optional
+from ..base import MikroTikBaseClient, log_and_reraise, make_request_body_builder
 from .models import MikroTikInterface, GetInterfacesArgs
 
+# Map options to request body with proper API parameter names
+_INTERFACE_OPTION_MAPPINGS = {
+    'name': 'name',
+    'type': 'type',
+    'disabled': 'disabled',
+    'running': 'running',
+    'comment': 'comment'
+}
+
+
 class MikroTikInterfaceClient(MikroTikBaseClient):
     """
     Specialized client for MikroTik interface management.
@@ -15,6 +25,7 @@ class MikroTikInterfaceClient(MikroTikBaseClient):
     Reference: MikroTik RouterOS API documentation for interface management
     """
     
+    @log_and_reraise("fetching interfaces")
     async def get_interfaces(self, options: Optional[GetInterfacesArgs] = None) -> List[MikroTikInterface]:
         """
         Get all interfaces configured on the device.
@@ -30,25 +41,13 @@ class MikroTikInterfaceClient(MikroTikBaseClient):
             List of interface configurations
             
         Raises:
-            requests.RequestException: For connection or API errors
+            aiohttp.ClientError: For connection or API errors
             ValueError: For invalid response data
         """
-        try:
-            request_body = self._build_interfaces_request_body(options or {})
-            response = self._make_request('POST', '/interface/print', request_body)
-            
-            if isinstance(response, list):
-                return response
-            elif isinstance(response, dict) and 'ret' in response:
-                return response['ret']
-            else:
-                self._log_warning(f"Unexpected response format: {type(response)}")
-                return []
-                
-        except Exception as e:
-            self._log_error(f"Error fetching interfaces: {str(e)}")
-            raise
+        request_body = self._build_interfaces_request_body(options or {})
+        return await self._print('/interface/print', request_body)
     
+    @log_and_reraise("fetching ethernet interfaces")
     async def get_ethernet_interfaces(self) -> List[MikroTikInterface]:
         """
         Get Ethernet interfaces configured on the device.
@@ -60,24 +59,12 @@ class MikroTikInterfaceClient(MikroTikBaseClient):
             List of Ethernet interface configurations
             
         Raises:
-            requests.RequestException: For connection or API errors
+            aiohttp.ClientError: For connection or API errors
             ValueError: For invalid response data
         """
-        try:
-            response = self._make_request('POST', '/interface/ethernet/print', {})
-            
-            if isinstance(response, list):
-                return response
-            elif isinstance(response, dict) and 'ret' in response:
-                return response['ret']
-            else:
-                self._log_warning(f"Unexpected response format: {type(response)}")
-                return []
-                
-        except Exception as e:
-            self._log_error(f"Error fetching Ethernet interfaces: {str(e)}")
-            raise
+        return await self._print('/interface/ethernet/print')
     
+    @log_and_reraise("fetching wireless interfaces")
     async def get_wireless_interfaces(self) -> List[MikroTikInterface]:
         """
         Get wireless interfaces configured on the device.
@@ -89,24 +76,12 @@ class MikroTikInterfaceClient(MikroTikBaseClient):
             List of wireless interface configurations
             
         Raises:
-            requests.RequestException: For connection or API errors
+            aiohttp.ClientError: For connection or API errors
             ValueError: For invalid response data
         """
-        try:
-            response = self._make_request('POST', '/interface/wireless/print', {})
-            
-            if isinstance(response, list):
-                return response
-            elif isinstance(response, dict) and 'ret' in response:
-                return response['ret']
-            else:
-                self._log_warning(f"Unexpected response format: {type(response)}")
-                return []
-                
-        except Exception as e:
-            self._log_error(f"Error fetching wireless interfaces: {str(e)}")
-            raise
+        return await self._print('/interface/wireless/print')
     
+    @log_and_reraise("fetching bridge interfaces")
     async def get_bridge_interfaces(self) -> List[MikroTikInterface]:
         """
         Get bridge interfaces configured on the device.
@@ -118,47 +93,12 @@ class MikroTikInterfaceClient(MikroTikBaseClient):
             List of bridge interface configurations
             
         Raises:
-            requests.RequestException: For connection or API errors
+            aiohttp.ClientError: For connection or API errors
             ValueError: For invalid response data
         """
-        try:
-            response = self._make_request('POST', '/interface/bridge/print', {})
-            
-            if isinstance(response, list):
-                return response
-            elif isinstance(response, dict) and 'ret' in response:
-                return response['ret']
-            else:
-                self._log_warning(f"Unexpected response format: {type(response)}")
-                return []
-                
-        except Exception as e:
-            self._log_error(f"Error fetching bridge interfaces: {str(e)}")
-            raise
+        return await self._print('/interface/bridge/print')
     
-    def _build_interfaces_request_body(self, options: GetInterfacesArgs) -> Dict[str, Any]:
-        """
-        Build the request body for interface API calls.
-        
-        Args:
-            options: Interface filtering options
-            
-        Returns:
-            Request body dictionary
-        """
-        request_body = {}
-        
-        # Map options to request body with proper API parameter names
-        option_mappings = {
-            'name': 'name',
-            'type': 'type',
-            'disabled': 'disabled',
-            'running': 'running',
-            'comment': 'comment'
-        }
-        
-        for option_key, api_key in option_mappings.items():
-            if options.get(option_key) is not None:
-                request_body[api_key] = options[option_key]
-        
-        return request_body
+    _build_interfaces_request_body = make_request_body_builder(
+        _INTERFACE_OPTION_MAPPINGS,
+        "Build the request body for interface API calls.",
+    )
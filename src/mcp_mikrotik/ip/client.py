@@ -5,10 +5,9 @@ This module provides a specialized client for IP management operations.
 It handles all IP-related API calls with proper error handling and validation.
 """
 from typing import Dict, List, Optional, Any
-import requests
 import asyncio
 
-from ..base import MikroTikBaseClient
+from ..base import TRANSPORT_ERRORS, MikroTikBaseClient, log_and_reraise, make_request_body_builder
 from .models import (
     MikroTikIPAddress,
     MikroTikIPRoute,
@@ -17,6 +16,26 @@ from .models import (
     GetIPRoutesArgs
 )
 
+# How long (seconds) responses are reused; pools rarely change, addresses and routes a bit more often
+IP_POOLS_CACHE_TTL = 60.0
+IP_ADDRESSES_CACHE_TTL = 10.0
+IP_ROUTES_CACHE_TTL = 10.0
+
+# Map options to request body with proper API parameter names
+_IP_ADDRESS_OPTION_MAPPINGS = {
+    'interface': 'interface',
+    'network': 'network',
+    'comment': 'comment',
+    'disabled': 'disabled'
+}
+
+_IP_ROUTE_OPTION_MAPPINGS = {
+    'dst_address': 'dst-address',
+    'gateway': 'gateway',
+    'routing_mark': 'routing-mark',
+    'disabled': 'disabled'
+}
+
 
 class MikroTikIPClient(MikroTikBaseClient):
     """
@@ -26,6 +45,7 @@ class MikroTikIPClient(MikroTikBaseClient):
     on MikroTik RouterOS devices.
     """
     
+    @log_and_reraise("fetching IP addresses")
     async def get_ip_addresses(self, options: Optional[GetIPAddressesArgs] = None) -> List[MikroTikIPAddress]:
         """
         Get IP addresses configured on the device.
@@ -37,29 +57,25 @@ class MikroTikIPClient(MikroTikBaseClient):
             List of IP address configurations
             
         Raises:
-            requests.ConnectionError: If there's a connection error
-            requests.Timeout: If the request times out
-            requests.HTTPError: If the API returns an HTTP error status
-            requests.RequestException: For other request-related errors
+            aiohttp.ClientConnectionError: If there's a connection error
+            asyncio.TimeoutError: If the request times out
+            aiohttp.ClientResponseError: If the API returns an HTTP error status
+            aiohttp.ClientError: For other request-related errors
             ValueError: For invalid response data
             TypeError: If the response is not in the expected format
         """
-        try:
-            request_body = self._build_ip_addresses_request_body(options or {})
-            response = self._make_request('POST', '/ip/address/print', request_body)
-            
-            if isinstance(response, list):
-                return response
-            elif isinstance(response, dict) and 'ret' in response:
-                return response['ret']
-            else:
-                self._log_warning(f"Unexpected response type: {type(response).__name__}")
-                return []
-                
-        except (requests.RequestException, ValueError, TypeError) as e:
-            self._log_error(f"Error fetching IP addresses: {str(e)}")
-            raise
+        request_body = self._build_ip_addresses_request_body(options or {})
+        response = await self._cached_request('POST', '/ip/address/print', request_body, ttl=IP_ADDRESSES_CACHE_TTL)
+        
+        if isinstance(response, list):
+            return response
+        elif isinstance(response, dict) and 'ret' in response:
+            return response['ret']
+        else:
+            self._log_warning(f"Unexpected response type: {type(response).__name__}")
+            return []
     
+    @log_and_reraise("fetching IP routes")
     async def get_ip_routes(self, options: Optional[GetIPRoutesArgs] = None) -> List[MikroTikIPRoute]:
         """
         Get IP routes configured on the device.
@@ -71,29 +87,25 @@ class MikroTikIPClient(MikroTikBaseClient):
             List of IP route configurations
             
         Raises:
-            requests.ConnectionError: If there's a connection error
-            requests.Timeout: If the request times out
-            requests.HTTPError: If the API returns an HTTP error status
-            requests.RequestException: For other request-related errors
+            aiohttp.ClientConnectionError: If there's a connection error
+            asyncio.TimeoutError: If the request times out
+            aiohttp.ClientResponseError: If the API returns an HTTP error status
+            aiohttp.ClientError: For other request-related errors
             ValueError: For invalid response data
             TypeError: If the response is not in the expected format
         """
-        try:
-            request_body = self._build_ip_routes_request_body(options or {})
-            response = self._make_request('POST', '/ip/route/print', request_body)
-            
-            if isinstance(response, list):
-                return response
-            elif isinstance(response, dict) and 'ret' in response:
-                return response['ret']
-            else:
-                self._log_warning(f"Unexpected response type: {type(response).__name__}")
-                return []
-                
-        except (requests.RequestException, ValueError, TypeError) as e:
-            self._log_error(f"Error fetching IP routes: {str(e)}")
-            raise
+        request_body = self._build_ip_routes_request_body(options or {})
+        response = await self._cached_request('POST', '/ip/route/print', request_body, ttl=IP_ROUTES_CACHE_TTL)
+        
+        if isinstance(response, list):
+            return response
+        elif isinstance(response, dict) and 'ret' in response:
+            return response['ret']
+        else:
+            self._log_warning(f"Unexpected response type: {type(response).__name__}")
+            return []
     
+    @log_and_reraise("fetching IP pools")
     async def get_ip_pools(self) -> List[MikroTikIPPool]:
         """
         Get IP pools configured on the device.
@@ -102,27 +114,22 @@ class MikroTikIPClient(MikroTikBaseClient):
             List of IP pool configurations
             
         Raises:
-            requests.ConnectionError: If there's a connection error
-            requests.Timeout: If the request times out
-            requests.HTTPError: If the API returns an HTTP error status
-            requests.RequestException: For other request-related errors
+            aiohttp.ClientConnectionError: If there's a connection error
+            asyncio.TimeoutError: If the request times out
+            aiohttp.ClientResponseError: If the API returns an HTTP error status
+            aiohttp.ClientError: For other request-related errors
             ValueError: For invalid response data
             TypeError: If the response is not in the expected format
         """
-        try:
-            response = self._make_request('POST', '/ip/pool/print', {})
-            
-            if isinstance(response, list):
-                return response
-            elif isinstance(response, dict) and 'ret' in response:
-                return response['ret']
-            else:
-                self._log_warning(f"Unexpected response type: {type(response).__name__}")
-                return []
-                
-        except (requests.RequestException, ValueError, TypeError) as e:
-            self._log_error(f"Error fetching IP pools: {str(e)}")
-            raise
+        response = await self._cached_request('POST', '/ip/pool/print', {}, ttl=IP_POOLS_CACHE_TTL)
+        
+        if isinstance(response, list):
+            return response
+        elif isinstance(response, dict) and 'ret' in response:
+            return response['ret']
+        else:
+            self._log_warning(f"Unexpected response type: {type(response).__name__}")
+            return []
     
     async def get_network_summary(self) -> Dict[str, Any]:
         """
@@ -132,74 +139,73 @@ class MikroTikIPClient(MikroTikBaseClient):
             Dictionary containing network configuration summary
             
         Raises:
-            requests.ConnectionError: If there's a connection error
-            requests.Timeout: If the request times out
-            requests.HTTPError: If the API returns an HTTP error status
-            requests.RequestException: For other request-related errors
+            aiohttp.ClientConnectionError: If there's a connection error
+            asyncio.TimeoutError: If the request times out
+            aiohttp.ClientResponseError: If the API returns an HTTP error status
+            aiohttp.ClientError: For other request-related errors
             ValueError: For invalid response data
             TypeError: If the response is not in the expected format
         """
         try:
             # Get all network configuration in parallel
-            addresses, routes, pools = await asyncio.gather(
-                self.get_ip_addresses(),
-                self.get_ip_routes(),
-                self.get_ip_pools(),
-                return_exceptions=True
-            )
+            tasks = {
+                "addresses": asyncio.create_task(self.get_ip_addresses()),
+                "routes": asyncio.create_task(self.get_ip_routes()),
+                "pools": asyncio.create_task(self.get_ip_pools()),
+            }
+            try:
+                await asyncio.wait(tasks.values())
+            except asyncio.CancelledError:
+                # Unlike gather, wait doesn't cancel the tasks it waits on
+                for task in tasks.values():
+                    task.cancel()
+                raise
             
             # Handle any exceptions that occurred
-            if isinstance(addresses, Exception):
-                self._log_error(f"Error fetching addresses: {addresses}")
-                addresses = []
-            if isinstance(routes, Exception):
-                self._log_error(f"Error fetching routes: {routes}")
-                routes = []
-            if isinstance(pools, Exception):
-                self._log_error(f"Error fetching pools: {pools}")
-                pools = []
+            results = {}
+            for name, task in tasks.items():
+                error = task.exception()
+                if error is not None:
+                    # Request errors were already logged by the getter
+                    if not isinstance(error, TRANSPORT_ERRORS):
+                        self._log_error(f"Error fetching {name}: {error}")
+                    results[name] = []
+                else:
+                    results[name] = task.result()
+            addresses, routes, pools = results["addresses"], results["routes"], results["pools"]
+            
+            # Collect interfaces and networks in a single pass over the addresses
+            interfaces, networks = set(), set()
+            for addr in addresses:
+                interface = addr.get('interface')
+                network = addr.get('network')
+                if interface:
+                    interfaces.add(interface)
+                if network:
+                    networks.add(network)
+            gateways = {gateway for route in routes if (gateway := route.get('gateway'))}
             
             return {
                 "ip_addresses_count": len(addresses),
                 "ip_routes_count": len(routes),
                 "ip_pools_count": len(pools),
-                "interfaces": list(set(addr.get('interface', '') for addr in addresses if addr.get('interface'))),
-                "networks": list(set(addr.get('network', '') for addr in addresses if addr.get('network'))),
-                "gateways": list(set(route.get('gateway', '') for route in routes if route.get('gateway')))
+                "interfaces": list(interfaces),
+                "networks": list(networks),
+                "gateways": list(gateways)
             }
             
         except Exception as e:
             self._log_error(f"Error generating network summary: {str(e)}")
             return {"error": str(e)}
     
-    def _build_ip_addresses_request_body(self, options: GetIPAddressesArgs) -> Dict[str, Any]:
-        """Build the request body for IP addresses API calls."""
-        request_body = {}
-        
-        # Map options to request body with proper API parameter names
-        if options.get('interface'):
-            request_body['interface'] = options['interface']
-        if options.get('network'):
-            request_body['network'] = options['network']
-        if options.get('comment'):
-            request_body['comment'] = options['comment']
-        if options.get('disabled') is not None:
-            request_body['disabled'] = options['disabled']
-        
-        return request_body
+    _build_ip_addresses_request_body = make_request_body_builder(
+        _IP_ADDRESS_OPTION_MAPPINGS,
+        "Build the request body for IP addresses API calls.",
+        skip_empty=('interface', 'network', 'comment'),
+    )
     
-    def _build_ip_routes_request_body(self, options: GetIPRoutesArgs) -> Dict[str, Any]:
-        """Build the request body for IP routes API calls."""
-        request_body = {}
-        
-        # Map options to request body with proper API parameter names
-        if options.get('dst_address'):
-            request_body['dst-address'] = options['dst_address']
-        if options.get('gateway'):
-            request_body['gateway'] = options['gateway']
-        if options.get('routing_mark'):
-            request_body['routing-mark'] = options['routing_mark']
-        if options.get('disabled') is not None:
-            request_body['disabled'] = options['disabled']
-        
-        return request_body
+    _build_ip_routes_request_body = make_request_body_builder(
+        _IP_ROUTE_OPTION_MAPPINGS,
+        "Build the request body for IP routes API calls.",
+        skip_empty=('dst_address', 'gateway', 'routing_mark'),
+    )
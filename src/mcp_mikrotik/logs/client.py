@@ -6,17 +6,181 @@ It handles all log-related API calls with proper error handling and validation.
 """
 import re
 import json
-from typing import Dict, List, Optional, Any, Union
-import requests
-from requests.auth import HTTPBasicAuth
+from contextlib import aclosing
+from functools import lru_cache
+from itertools import islice
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
-from ..base import MikroTikBaseClient
+from ..base import MikroTikBaseClient, log_and_reraise
 from .models import (
     MikroTikLogEntry,
     GetLogsArgs,
     GetLogsByConditionArgs
 )
 
+# A single filter condition: field, operator and quoted value, e.g. topics~i"system"
+_CONDITION_RE = re.compile(r'(topics|message)(~i|~|=)"([^"]+)"')
+
+# Operator -> test(field_text, value); '~i' is compiled separately, on lower-cased text
+_CONDITION_OPERATORS = {
+    '~': lambda text, value: value in text,
+    '=': lambda text, value: value == text,
+}
+
+# Map options to request body with proper API parameter names ('where' is applied client-side)
+_LOG_OPTION_MAPPINGS = {
+    'append': 'append',
+    'brief': 'brief',
+    'countOnly': 'count-only',
+    'detail': 'detail',
+    'file': 'file',
+    'follow': 'follow',
+    'followOnly': 'follow-only',
+    'groupBy': 'group-by',
+    'interval': 'interval',
+    'proplist': '.proplist',
+    'showIds': 'show-ids',
+    'terse': 'terse',
+    'withExtraInfo': 'with-extra-info',
+    'withoutPaging': 'without-paging'
+}
+
+# Properties RouterOS shows for 'print brief'; requested instead of whole entries when brief is set
+BRIEF_LOG_PROPERTIES = ('.id', 'time', 'topics', 'message')
+
+# Tokens of a where expression: a parenthesis, a word with a quoted value, or a bare word
+_WHERE_TOKEN_RE = re.compile(r'\s*([()]|[^\s()"]*"[^"]*"|[^\s()"]+)')
+
+LogPredicate = Callable[[MikroTikLogEntry], bool]
+
+# Compiled sub-conditions also receive a per-entry cache of lower-cased fields, shared by
+# all '~i' conditions so each field is lower-cased at most once per entry
+_EntryPredicate = Callable[[MikroTikLogEntry, Optional[Dict[str, str]]], bool]
+
+
+def _tokenize_where(where: str) -> List[str]:
+    """Split a where expression into tokens, keeping quoted values (spaces included) intact."""
+    where = where.strip()
+    tokens = []
+    pos = 0
+    while pos < len(where):
+        match = _WHERE_TOKEN_RE.match(where, pos)
+        if match is None:
+            raise ValueError(f"Unexpected character at position {pos}: {where[pos:]!r}")
+        tokens.append(match.group(1))
+        pos = match.end()
+    return tokens
+
+
+def _compile_condition(token: str, unsupported: List[str], case_insensitive: List[str]) -> _EntryPredicate:
+    """Compile a single condition such as topics~"system" into a predicate."""
+    match = _CONDITION_RE.fullmatch(token)
+    if match is None:
+        # Unknown conditions pass through rather than hiding every entry
+        unsupported.append(token)
+        return lambda log, lowered: True
+    
+    field, operator, value = match.groups()
+    if operator != '~i':
+        test = _CONDITION_OPERATORS[operator]
+        
+        def predicate(log: MikroTikLogEntry, lowered: Optional[Dict[str, str]]) -> bool:
+            text = log.get(field)
+            return bool(text) and test(text, value)
+        
+        return predicate
+    
+    value = value.lower()
+    case_insensitive.append(field)
+    
+    def case_insensitive_predicate(log: MikroTikLogEntry, lowered: Optional[Dict[str, str]]) -> bool:
+        text = lowered.get(field)
+        if text is None:
+            raw = log.get(field)
+            if not raw:
+                return False
+            text = lowered[field] = raw.lower()
+        return value in text
+    
+    return case_insensitive_predicate
+
+
+def _all_of(predicates: List[_EntryPredicate]) -> _EntryPredicate:
+    if len(predicates) == 1:
+        return predicates[0]
+    return lambda log, lowered: all(predicate(log, lowered) for predicate in predicates)
+
+
+def _any_of(predicates: List[_EntryPredicate]) -> _EntryPredicate:
+    if len(predicates) == 1:
+        return predicates[0]
+    return lambda log, lowered: any(predicate(log, lowered) for predicate in predicates)
+
+
+@lru_cache(maxsize=128)
+def _compile_where(where: str) -> Tuple[LogPredicate, Tuple[str, ...]]:
+    """
+    Compile a where expression into a single predicate over log entries.
+    
+    Grammar (``and`` binds tighter than ``or``, as in RouterOS):
+        expr   := term ('or' term)*
+        term   := factor ('and' factor)*
+        factor := '(' expr ')' | condition
+    
+    Returns:
+        The predicate and the conditions that were not understood
+        
+    Raises:
+        ValueError: If the expression is malformed
+    """
+    tokens = _tokenize_where(where)
+    unsupported: List[str] = []
+    case_insensitive: List[str] = []
+    pos = 0
+    
+    def parse_expr() -> _EntryPredicate:
+        nonlocal pos
+        terms = [parse_term()]
+        while pos < len(tokens) and tokens[pos] == 'or':
+            pos += 1
+            terms.append(parse_term())
+        return _any_of(terms)
+    
+    def parse_term() -> _EntryPredicate:
+        nonlocal pos
+        factors = [parse_factor()]
+        while pos < len(tokens) and tokens[pos] == 'and':
+            pos += 1
+            factors.append(parse_factor())
+        return _all_of(factors)
+    
+    def parse_factor() -> _EntryPredicate:
+        nonlocal pos
+        if pos >= len(tokens):
+            raise ValueError("Unexpected end of filter expression")
+        token = tokens[pos]
+        pos += 1
+        if token == '(':
+            predicate = parse_expr()
+            if pos >= len(tokens) or tokens[pos] != ')':
+                raise ValueError("Missing closing parenthesis")
+            pos += 1
+            return predicate
+        if token in ('and', 'or', ')'):
+            raise ValueError(f"Unexpected {token!r} in filter expression")
+        return _compile_condition(token, unsupported, case_insensitive)
+    
+    entry_predicate = parse_expr()
+    if pos != len(tokens):
+        raise ValueError(f"Unexpected {tokens[pos]!r} in filter expression")
+    
+    # Only pay for the per-entry lower-case cache when a '~i' condition needs it
+    if case_insensitive:
+        predicate = lambda log: entry_predicate(log, {})
+    else:
+        predicate = lambda log: entry_predicate(log, None)
+    return predicate, tuple(unsupported)
+
 
 class MikroTikLogsClient(MikroTikBaseClient):
     """
@@ -26,6 +190,10 @@ class MikroTikLogsClient(MikroTikBaseClient):
     system logs from MikroTik RouterOS devices.
     """
     
+    # Constant filters of the category helpers, compiled once when the class is defined
+    _TOPIC_WHERE = {topic: f'topics~"{topic}"' for topic in ('debug', 'error', 'warning', 'info')}
+    _TOPIC_PREDICATES = {topic: _compile_where(where)[0] for topic, where in _TOPIC_WHERE.items()}
+    
     async def get_logs(
         self, 
         options: Optional[GetLogsArgs] = None, 
@@ -47,43 +215,66 @@ class MikroTikLogsClient(MikroTikBaseClient):
             List of log entries or log count (if countOnly is True)
             
         Raises:
-            requests.ConnectionError: If there's a connection error
-            requests.Timeout: If the request times out
-            requests.HTTPError: If the API returns an HTTP error status
-            requests.RequestException: For other request-related errors
+            aiohttp.ClientConnectionError: If there's a connection error
+            asyncio.TimeoutError: If the request times out
+            aiohttp.ClientResponseError: If the API returns an HTTP error status
+            aiohttp.ClientError: For other request-related errors
             ValueError: For invalid response data
             TypeError: If the response is not in the expected format
         """
         if options is None:
             options = {}
         
-        request_body = self._build_logs_request_body(options)
+        where = options.get('where')
+        predicate = self._where_predicate(where) if where else None
+        return await self._get_logs_with_predicate(options, predicate, max_logs)
+    
+    @log_and_reraise("retrieving logs")
+    async def _get_logs_with_predicate(
+        self,
+        options: GetLogsArgs,
+        predicate: Optional[LogPredicate],
+        max_logs: Optional[int]
+    ) -> Union[List[MikroTikLogEntry], int]:
+        """
+        Fetch logs and filter them with an already compiled where predicate.
         
-        try:
-            response = self._make_request('POST', '/log/print', request_body)
-            
-            # Handle countOnly response
-            if options.get('countOnly'):
-                return self._handle_count_only_response(response)
-            
-            # Process log entries
-            logs = self._extract_log_entries(response)
-            
-            # Apply client-side filtering if where parameter is provided
-            where = options.get('where')
-            if where:
-                logs = self._filter_logs(logs, where)
-            
-            # Limit the number of logs if max_logs is specified
-            if max_logs is not None and len(logs) > max_logs:
-                self._log_warning(f"Limiting logs to {max_logs} entries (retrieved {len(logs)})")
-                logs = logs[:max_logs]
-            
-            return logs
+        Args:
+            options: Options for retrieving logs
+            predicate: Compiled client-side filter, None for no filtering
+            max_logs: Maximum number of logs to return, None for no limit
             
-        except (requests.RequestException, ValueError, TypeError) as e:
-            self._log_error(f"Error retrieving logs: {str(e)}")
-            raise
+        Returns:
+            List of log entries or log count (if countOnly is True)
+        """
+        request_body = self._build_logs_request_body(options)
+        
+        response = await self._make_request('POST', '/log/print', request_body,
+                                            stream=not options.get('countOnly'))
+        
+        # Handle countOnly response
+        if options.get('countOnly'):
+            return self._handle_count_only_response(response)
+        
+        # Streamed response: filter entries as they arrive and stop once max_logs is exceeded
+        if hasattr(response, '__aiter__'):
+            return await self._collect_log_stream(response, predicate, max_logs)
+        
+        # Take at most one entry past max_logs (enough to know whether to warn)
+        limit = None if max_logs is None else max_logs + 1
+        
+        # Apply client-side filtering if a where condition was given
+        if predicate is not None:
+            logs = self._apply_predicate(self._extract_log_entries(response), predicate, limit)
+        else:
+            logs = list(islice(self._iter_log_entries(response), limit))
+        
+        # Limit the number of logs if max_logs is specified
+        if max_logs is not None and len(logs) > max_logs:
+            self._log_warning(f"Limiting logs to {max_logs} entries (more available)")
+            logs = logs[:max_logs]
+        
+        return logs
     
     async def get_debug_logs(
         self, 
@@ -100,14 +291,7 @@ class MikroTikLogsClient(MikroTikBaseClient):
         Returns:
             List of debug log entries
         """
-        if options is None:
-            options = {}
-        
-        return await self.get_logs({
-            **options,
-            'where': 'topics~"debug"',
-            'brief': True
-        }, max_logs=max_logs)
+        return await self._get_topic_logs('debug', options, max_logs)
     
     async def get_error_logs(
         self, 
@@ -124,14 +308,7 @@ class MikroTikLogsClient(MikroTikBaseClient):
         Returns:
             List of error log entries
         """
-        if options is None:
-            options = {}
-        
-        return await self.get_logs({
-            **options,
-            'where': 'topics~"error"',
-            'brief': True
-        }, max_logs=max_logs)
+        return await self._get_topic_logs('error', options, max_logs)
     
     async def get_warning_logs(
         self, 
@@ -148,14 +325,7 @@ class MikroTikLogsClient(MikroTikBaseClient):
         Returns:
             List of warning log entries
         """
-        if options is None:
-            options = {}
-        
-        return await self.get_logs({
-            **options,
-            'where': 'topics~"warning"',
-            'brief': True
-        }, max_logs=max_logs)
+        return await self._get_topic_logs('warning', options, max_logs)
     
     async def get_info_logs(
         self, 
@@ -172,14 +342,79 @@ class MikroTikLogsClient(MikroTikBaseClient):
         Returns:
             List of info log entries
         """
-        if options is None:
-            options = {}
+        return await self._get_topic_logs('info', options, max_logs)
+    
+    async def _get_topic_logs(
+        self,
+        topic: str,
+        options: Optional[Dict[str, Any]],
+        max_logs: int
+    ) -> List[MikroTikLogEntry]:
+        """Get brief logs of one topic using the predicate compiled for it at class definition."""
+        opts = dict(options or ())
+        opts['where'] = self._TOPIC_WHERE[topic]
+        opts['brief'] = True
+        return await self._get_logs_with_predicate(opts, self._TOPIC_PREDICATES[topic], max_logs)
+    
+    @log_and_reraise("retrieving logs by topic")
+    async def get_all_logs_partitioned(
+        self,
+        options: Optional[Dict[str, Any]] = None,
+        max_logs: Optional[int] = 1000
+    ) -> Dict[str, List[MikroTikLogEntry]]:
+        """
+        Get debug, error, warning and info logs with a single /log/print call.
+        
+        Fetches the log once and sorts the entries client-side with the same
+        predicates as get_debug_logs, get_error_logs, get_warning_logs and
+        get_info_logs. An entry with several of these topics appears in each
+        matching list.
+        
+        Reading the response stops once every topic has more than max_logs
+        matching entries.
+        
+        Args:
+            options: Additional options (any 'where' condition is replaced)
+            max_logs: Maximum number of logs per topic (default: 1000),
+                None for no limit
+            
+        Returns:
+            Dictionary mapping each topic to its log entries
+        """
+        opts = dict(options or ())
+        opts.pop('where', None)
+        opts.pop('countOnly', None)
+        opts['brief'] = True
+        response = await self._make_request('POST', '/log/print', self._build_logs_request_body(opts),
+                                            stream=True)
+        
+        partitions: Dict[str, List[MikroTikLogEntry]] = {topic: [] for topic in self._TOPIC_PREDICATES}
+        truncated = set()
+        
+        def add(log: MikroTikLogEntry) -> bool:
+            """Sort one entry into its topics; True once every topic is over max_logs."""
+            for topic, predicate in self._TOPIC_PREDICATES.items():
+                if predicate(log):
+                    if max_logs is None or len(partitions[topic]) < max_logs:
+                        partitions[topic].append(log)
+                    else:
+                        truncated.add(topic)
+            return len(truncated) == len(partitions)
+        
+        if hasattr(response, '__aiter__'):
+            async with aclosing(response):
+                async for log in response:
+                    if add(log):
+                        break
+        else:
+            for log in self._iter_log_entries(response):
+                if add(log):
+                    break
         
-        return await self.get_logs({
-            **options,
-            'where': 'topics~"info"',
-            'brief': True
-        }, max_logs=max_logs)
+        for topic in truncated:
+            self._log_warning(f"Limiting {topic} logs to {max_logs} entries (more available)")
+        
+        return partitions
     
     async def get_logs_from_buffer(
         self, 
@@ -198,13 +433,9 @@ class MikroTikLogsClient(MikroTikBaseClient):
         Returns:
             List of log entries from the specified buffer
         """
-        if options is None:
-            options = {}
-        
-        return await self.get_logs({
-            'where': f'buffer={buffer_name}',
-            **options,
-        }, max_logs=max_logs)
+        opts = dict(options or ())
+        opts.setdefault('where', f'buffer={buffer_name}')
+        return await self.get_logs(opts, max_logs=max_logs)
     
     async def get_logs_with_extra_info(
         self, 
@@ -225,13 +456,9 @@ class MikroTikLogsClient(MikroTikBaseClient):
         Returns:
             List of log entries with extra info (if available)
         """
-        if options is None:
-            options = {}
-        
-        return await self.get_logs({
-            'withExtraInfo': True,
-            **options,
-        }, max_logs=max_logs)
+        opts = dict(options or ())
+        opts.setdefault('withExtraInfo', True)
+        return await self.get_logs(opts, max_logs=max_logs)
     
     async def find_logs(
         self, 
@@ -251,13 +478,9 @@ class MikroTikLogsClient(MikroTikBaseClient):
         Returns:
             List of matching log entries
         """
-        if options is None:
-            options = {}
-        
-        return await self.get_logs({
-            **options,
-            'where': where
-        })
+        opts = dict(options or ())
+        opts['where'] = where
+        return await self.get_logs(opts)
     
     async def get_logs_by_condition(
         self, 
@@ -278,39 +501,29 @@ class MikroTikLogsClient(MikroTikBaseClient):
         Returns:
             List of filtered log entries
         """
-        if options is None:
-            options = {}
-        
-        return await self.get_logs({
-            'where': condition,
-            **options
-        }, max_logs=max_logs)
+        opts = dict(options or ())
+        opts.setdefault('where', condition)
+        return await self.get_logs(opts, max_logs=max_logs)
 
     def _build_logs_request_body(self, options: GetLogsArgs) -> Dict[str, Any]:
         """Build the request body for log API calls."""
-        request_body = {}
-        
-        # Map options to request body with proper API parameter names
-        option_mappings = {
-            'append': 'append',
-            'brief': 'brief',
-            'countOnly': 'count-only',
-            'detail': 'detail',
-            'file': 'file',
-            'follow': 'follow',
-            'followOnly': 'follow-only',
-            'groupBy': 'group-by',
-            'interval': 'interval',
-            'proplist': 'proplist',
-            'showIds': 'show-ids',
-            'terse': 'terse',
-            'withExtraInfo': 'with-extra-info',
-            'withoutPaging': 'without-paging'
-        }
-        
-        for option_key, api_key in option_mappings.items():
-            if options.get(option_key) is not None:
-                request_body[api_key] = options[option_key]
+        if not options:
+            return {}
+        
+        request_body = {_LOG_OPTION_MAPPINGS[key]: value for key, value in options.items()
+                        if value is not None and key in _LOG_OPTION_MAPPINGS}
+        
+        # Only ask the device for the properties that will actually be used
+        proplist = request_body.get('.proplist')
+        if proplist is None and options.get('brief') and not options.get('countOnly'):
+            proplist = BRIEF_LOG_PROPERTIES
+        if proplist is not None:
+            # RouterOS also accepts a comma-separated string
+            if isinstance(proplist, str):
+                proplist = [prop.strip() for prop in proplist.split(',') if prop.strip()]
+            # Fields referenced by the client-side filter must always be fetched
+            where_fields = [field for field, _, _ in _CONDITION_RE.findall(options.get('where') or '')]
+            request_body['.proplist'] = list(dict.fromkeys([*proplist, *where_fields]))
         
         return request_body
     
@@ -330,20 +543,76 @@ class MikroTikLogsClient(MikroTikBaseClient):
     
     def _extract_log_entries(self, response: Any) -> List[MikroTikLogEntry]:
         """Extract log entries from the API response."""
+        return list(self._iter_log_entries(response))
+    
+    def _iter_log_entries(self, response: Any) -> Iterator[MikroTikLogEntry]:
+        """Iterate over the log entries of the API response."""
         if isinstance(response, list):
-            return response
+            yield from response
         elif isinstance(response, dict):
             # Some API endpoints return a dict with a 'ret' property
             if 'ret' in response:
-                return response['ret']
+                yield from response['ret']
             else:
                 self._log_note(f"Received dict response: {response}")
-                return []
         else:
             self._log_warning(f"Unexpected response type: {type(response).__name__}")
-            return []
     
-    def _filter_logs(self, logs: List[MikroTikLogEntry], where: str) -> List[MikroTikLogEntry]:
+    async def _collect_log_stream(
+        self,
+        entries: AsyncIterator[MikroTikLogEntry],
+        predicate: Optional[LogPredicate],
+        max_logs: Optional[int]
+    ) -> List[MikroTikLogEntry]:
+        """
+        Filter and truncate a streamed log response without buffering all of it.
+        
+        Args:
+            entries: Log entries as they are parsed from the response
+            predicate: Compiled client-side filter, None for no filtering
+            max_logs: Maximum number of entries to keep, None for no limit
+            
+        Returns:
+            Matching log entries, at most max_logs of them
+        """
+        logs = []
+        async with aclosing(entries):
+            async for entry in entries:
+                if predicate is None or predicate(entry):
+                    logs.append(entry)
+                    # Read one match past the limit, just to know whether to warn
+                    if max_logs is not None and len(logs) > max_logs:
+                        break
+        
+        if max_logs is not None and len(logs) > max_logs:
+            self._log_warning(f"Limiting logs to {max_logs} entries (more available)")
+            del logs[max_logs:]
+        
+        return logs
+    
+    def _where_predicate(self, where: str) -> Optional[LogPredicate]:
+        """
+        Compile a where condition, logging unsupported parts.
+        
+        Returns:
+            The predicate, or None if the condition is invalid (no filtering)
+        """
+        try:
+            predicate, unsupported = _compile_where(where)
+        except ValueError as e:
+            self._log_error(f"Filter parsing error: {str(e)}")
+            self._log_error(f"Invalid filter syntax: '{where}'. Returning all logs.")
+            return None
+        for condition in unsupported:
+            self._log_warning(f"Unsupported filter condition: '{condition}'")
+        return predicate
+    
+    def _filter_logs(
+        self,
+        logs: List[MikroTikLogEntry],
+        where: str,
+        limit: Optional[int] = None
+    ) -> List[MikroTikLogEntry]:
         """
         Client-side filtering implementation for log entries.
         
@@ -357,6 +626,9 @@ class MikroTikLogsClient(MikroTikBaseClient):
         - Case-insensitive contains: field~i"value"
         - Multiple conditions with AND: condition1 and condition2
         - Multiple conditions with OR: condition1 or condition2
+        - Mixed AND/OR (AND binds tighter) and parentheses for grouping
+        
+        Quoted values may contain spaces and the words 'and'/'or'.
         
         Currently supported fields:
         - topics: Filter by log topics (e.g., topics~"system")
@@ -367,10 +639,12 @@ class MikroTikLogsClient(MikroTikBaseClient):
         - message~"error"
         - topics~"dhcp" and message~"assigned"
         - topics~"system" or topics~"dhcp"
+        - (topics~"dhcp" or topics~"system") and message~"login and logout"
         
         Args:
             logs: List of log entries to filter
             where: Filter condition string
+            limit: Stop after this many matches (None for no limit)
             
         Returns:
             Filtered list of log entries
@@ -382,110 +656,22 @@ class MikroTikLogsClient(MikroTikBaseClient):
         if not where:
             return logs
         
+        # Compiled once per distinct where string, then reused across calls
+        predicate = self._where_predicate(where)
+        if predicate is None:
+            return logs
+        
+        return self._apply_predicate(logs, predicate, limit)
+    
+    def _apply_predicate(
+        self,
+        logs: List[MikroTikLogEntry],
+        predicate: LogPredicate,
+        limit: Optional[int] = None
+    ) -> List[MikroTikLogEntry]:
+        """Return the entries matching predicate, at most limit of them (all logs on error)."""
         try:
-            # Handle OR conditions first, then AND conditions
-            if ' or ' in where:
-                # Split by OR first, then handle each OR group
-                or_groups = where.split(' or ')
-                filtered_logs = []
-                for log in logs:
-                    # A log entry must match at least one OR group
-                    if any(self._check_condition(log, or_group.strip()) for or_group in or_groups):
-                        filtered_logs.append(log)
-                return filtered_logs
-            else:
-                # Split the condition by 'and' to support multiple AND conditions
-                conditions = where.split(' and ')
-                
-                filtered_logs = []
-                for log in logs:
-                    # A log entry must match all conditions to be included
-                    if all(self._check_condition(log, condition) for condition in conditions):
-                        filtered_logs.append(log)
-                
-                return filtered_logs
+            return list(islice((log for log in logs if predicate(log)), limit))
         except Exception as e:
-            self._log_error(f"Filter parsing error: {str(e)}")
-            self._log_error(f"Invalid filter syntax: '{where}'. Returning all logs.")
-            return logs  # Return all logs if filter parsing fails
-    
-    def _check_condition(self, log: MikroTikLogEntry, condition: str) -> bool:
-        """
-        Check if a log entry matches a specific filter condition.
-        
-        This method parses a single condition string and checks if the log entry matches it.
-        Supports various filter syntaxes:
-        - Contains (~): field~"value" - Checks if field contains value
-        - Equals (=): field="value" - Checks if field equals value exactly
-        - Case-insensitive contains (~i): field~i"value" - Case-insensitive contains
-        
-        Args:
-            log: Log entry to check
-            condition: Filter condition
-            
-        Returns:
-            True if the log matches the condition, False otherwise
-        """
-        # Contains operator for topics field
-        if 'topics~' in condition and 'topics~i' not in condition:
-            match = re.search(r'topics~"([^"]+)"', condition)
-            if match and match.group(1):
-                value = match.group(1)
-                topics = log.get('topics', '')
-                if not topics:
-                    return False
-                return value in topics
-        
-        # Contains operator for message field
-        elif 'message~' in condition and 'message~i' not in condition:
-            match = re.search(r'message~"([^"]+)"', condition)
-            if match and match.group(1):
-                value = match.group(1)
-                message = log.get('message', '')
-                if not message:
-                    return False
-                return value in message
-        
-        # Equality operator for topics field
-        elif 'topics=' in condition:
-            match = re.search(r'topics="([^"]+)"', condition)
-            if match and match.group(1):
-                value = match.group(1)
-                topics = log.get('topics', '')
-                if not topics:
-                    return False
-                return value == topics
-        
-        # Equality operator for message field
-        elif 'message=' in condition:
-            match = re.search(r'message="([^"]+)"', condition)
-            if match and match.group(1):
-                value = match.group(1)
-                message = log.get('message', '')
-                if not message:
-                    return False
-                return value == message
-        
-        # Case-insensitive contains operator for topics field
-        elif 'topics~i' in condition:
-            match = re.search(r'topics~i"([^"]+)"', condition)
-            if match and match.group(1):
-                value = match.group(1).lower()
-                topics = log.get('topics', '').lower()
-                if not topics:
-                    return False
-                return value in topics
-        
-        # Case-insensitive contains operator for message field
-        elif 'message~i' in condition:
-            match = re.search(r'message~i"([^"]+)"', condition)
-            if match and match.group(1):
-                value = match.group(1).lower()
-                message = log.get('message', '').lower()
-                if not message:
-                    return False
-                return value in message
-        
-        # Unknown condition - log a warning and pass through
-        self._log_warning(f"Unsupported filter condition: '{condition}'")
-        return True
+            self._log_error(f"Filter evaluation error: {str(e)}. Returning all logs.")
+            return logs  # Return all logs if the filter cannot be applied
@@ -3,7 +3,7 @@ MikroTik Logs Type Definitions
 
 This module contains type definitions for log-related operations in the MikroTik API.
 """
-from typing import Dict, List, Optional, TypedDict, Any, Union
+from typing import Dict, List, Optional, Tuple, TypedDict, Any, Union
 
 
 class MikroTikLogEntry(TypedDict, total=False):
@@ -66,6 +66,36 @@ class GetLogsByConditionArgs(TypedDict, total=False):
     withoutPaging: Optional[bool]
 
 
+# Exact types accepted for each optional log argument shared by both validators.
+# bool is an int subclass, so exact types are compared to keep True/False out of 'interval'.
+_BASE_LOG_TYPES: Dict[str, Tuple[type, ...]] = {
+    'append': (bool,),
+    'brief': (bool,),
+    'countOnly': (bool,),
+    'detail': (bool,),
+    'file': (str,),
+    'follow': (bool,),
+    'followOnly': (bool,),
+    'groupBy': (str,),
+    'interval': (int, float),
+    'proplist': (list,),
+    'showIds': (bool,),
+    'terse': (bool,),
+    'withExtraInfo': (bool,),
+    'withoutPaging': (bool,),
+}
+_LOG_TYPES: Dict[str, Tuple[type, ...]] = {**_BASE_LOG_TYPES, 'where': (str,)}
+
+
+def _has_valid_types(args: Dict[str, Any], types: Dict[str, Tuple[type, ...]]) -> bool:
+    """Check that every argument listed in types has one of its expected types."""
+    for field, value in args.items():
+        expected_types = types.get(field)
+        if expected_types is not None and type(value) not in expected_types:
+            return False
+    return True
+
+
 def is_valid_get_logs_args(args: Any) -> bool:
     """
     Validate that the provided arguments match the GetLogsArgs structure.
@@ -78,31 +108,13 @@ def is_valid_get_logs_args(args: Any) -> bool:
     """
     if not isinstance(args, dict):
         return False
+    
+    # No options at all is the common case and always valid
+    if not args:
+        return True
         
     # Check each field for correct type
-    type_checks = {
-        'append': bool,
-        'brief': bool,
-        'countOnly': bool,
-        'detail': bool,
-        'file': str,
-        'follow': bool,
-        'followOnly': bool,
-        'groupBy': str,
-        'interval': (int, float),
-        'proplist': list,
-        'showIds': bool,
-        'terse': bool,
-        'where': str,
-        'withExtraInfo': bool,
-        'withoutPaging': bool
-    }
-    
-    for field, expected_type in type_checks.items():
-        if field in args and not isinstance(args[field], expected_type):
-            return False
-            
-    return True
+    return _has_valid_types(args, _LOG_TYPES)
 
 
 def is_valid_get_logs_by_condition_args(args: Any) -> bool:
@@ -115,32 +127,9 @@ def is_valid_get_logs_by_condition_args(args: Any) -> bool:
     Returns:
         bool: True if arguments are valid, False otherwise
     """
-    if not isinstance(args, dict) or 'condition' not in args:
-        return False
-        
-    if not isinstance(args['condition'], str):
+    # A missing condition reads as None, which also fails the str check
+    if not isinstance(args, dict) or type(args.get('condition')) is not str:
         return False
         
     # Check each field for correct type
-    type_checks = {
-        'append': bool,
-        'brief': bool,
-        'countOnly': bool,
-        'detail': bool,
-        'file': str,
-        'follow': bool,
-        'followOnly': bool,
-        'groupBy': str,
-        'interval': (int, float),
-        'proplist': list,
-        'showIds': bool,
-        'terse': bool,
-        'withExtraInfo': bool,
-        'withoutPaging': bool
-    }
-    
-    for field, expected_type in type_checks.items():
-        if field in args and not isinstance(args[field], expected_type):
-            return False
-            
-    return True
+    return _has_valid_types(args, _BASE_LOG_TYPES)
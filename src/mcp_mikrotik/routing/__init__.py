@@ -12,8 +12,14 @@ This module provides specialized client functionality for MikroTik routing manag
 # - /routing/table/print - Routing tables
 # - Route redistribution and policy routing
 
-from .client import MikroTikRoutingClient
-
 __all__ = [
     "MikroTikRoutingClient"
 ]
+
+
+def __getattr__(name):
+    # Import the client on first use so importing the package stays cheap
+    if name == "MikroTikRoutingClient":
+        from .client import MikroTikRoutingClient
+        return MikroTikRoutingClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,10 +6,11 @@ It includes methods for retrieving system information, resources, and status.
 """
 
 from .client import MikroTikSystemClient
-from .models import MikroTikSystemInfo, MikroTikResourceInfo
+from .models import MikroTikSystemInfo, MikroTikResourceInfo, SystemInfo
 
 __all__ = [
     "MikroTikSystemClient",
     "MikroTikSystemInfo",
-    "MikroTikResourceInfo"
+    "MikroTikResourceInfo",
+    "SystemInfo"
 ]
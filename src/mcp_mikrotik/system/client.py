@@ -4,11 +4,31 @@ MikroTik System Client
 This module provides a specialized client for system management operations.
 It handles all system-related API calls with proper error handling and validation.
 """
-from typing import Dict, List, Optional, Any
-import requests
+from bisect import bisect_left
+from typing import Dict, Optional, Any
 
-from ..base import MikroTikBaseClient
-from .models import MikroTikSystemInfo
+from ..base import TRANSPORT_ERRORS, MikroTikBaseClient, log_and_reraise
+from .models import MikroTikResourceInfo, SystemInfo
+
+# How long (seconds) a /system/resource response is reused, so that
+# get_system_info, get_system_resources and get_system_health called
+# back to back (e.g. by a polling dashboard) share one round-trip
+SYSTEM_RESOURCE_CACHE_TTL = 1.0
+
+# Bytes -> MiB factor
+_INV_MIB = 1.0 / (1024 * 1024)
+
+# Health status values reported by get_system_health
+_STATUS_HEALTHY = "healthy"
+_STATUS_ATTENTION = "attention"
+_STATUS_WARNING = "warning"
+_STATUS_CRITICAL = "critical"
+
+# Usage percentages above each threshold map to the next status in _HEALTH_STATUS
+_HEALTH_THRESHOLDS = (70, 80, 90)
+_HEALTH_STATUS = (_STATUS_HEALTHY, _STATUS_ATTENTION, _STATUS_WARNING, _STATUS_CRITICAL)
+
+_EMPTY_HEALTH = {"status": "unknown", "error": "No system information available"}
 
 
 class MikroTikSystemClient(MikroTikBaseClient):
@@ -19,6 +39,7 @@ class MikroTikSystemClient(MikroTikBaseClient):
     and status from MikroTik RouterOS devices.
     """
     
+    @log_and_reraise("fetching system info")
     async def get_system_info(self) -> Dict[str, Any]:
         """
         Get system information.
@@ -27,30 +48,27 @@ class MikroTikSystemClient(MikroTikBaseClient):
             System information dictionary
             
         Raises:
-            requests.ConnectionError: If there's a connection error
-            requests.Timeout: If the request times out
-            requests.HTTPError: If the API returns an HTTP error status
-            requests.RequestException: For other request-related errors
+            aiohttp.ClientConnectionError: If there's a connection error
+            asyncio.TimeoutError: If the request times out
+            aiohttp.ClientResponseError: If the API returns an HTTP error status
+            aiohttp.ClientError: For other request-related errors
             ValueError: For invalid response data
             TypeError: If the response is not in the expected format
         """
-        try:
-            response = self._make_request('POST', '/system/resource/print', {})
-            
-            # The RouterOS API returns an array directly, not wrapped in a 'ret' property
-            if isinstance(response, list) and len(response) > 0:
-                return response[0]
-            elif isinstance(response, list) and len(response) == 0:
-                self._log_warning("Empty system info response")
-                return {}
-            elif not isinstance(response, list):
-                raise TypeError(f"Expected list response, got {type(response).__name__}")
+        response = await self._fetch_resources()
+        
+        # The RouterOS API returns an array directly, not wrapped in a 'ret' property
+        if isinstance(response, list) and len(response) > 0:
+            return response[0]
+        elif isinstance(response, list) and len(response) == 0:
+            self._log_warning("Empty system info response")
             return {}
-        except (requests.RequestException, ValueError, TypeError) as e:
-            self._log_error(f"Error fetching system info: {str(e)}")
-            raise
+        elif not isinstance(response, list):
+            raise TypeError(f"Expected list response, got {type(response).__name__}")
+        return {}
     
-    async def get_system_resources(self) -> List[MikroTikSystemInfo]:
+    @log_and_reraise("fetching system resources")
+    async def get_system_resources(self) -> MikroTikResourceInfo:
         """
         Get detailed system resource information.
         
@@ -58,26 +76,28 @@ class MikroTikSystemClient(MikroTikBaseClient):
             List of system resource information entries
             
         Raises:
-            requests.ConnectionError: If there's a connection error
-            requests.Timeout: If the request times out
-            requests.HTTPError: If the API returns an HTTP error status
-            requests.RequestException: For other request-related errors
+            aiohttp.ClientConnectionError: If there's a connection error
+            asyncio.TimeoutError: If the request times out
+            aiohttp.ClientResponseError: If the API returns an HTTP error status
+            aiohttp.ClientError: For other request-related errors
             ValueError: For invalid response data
             TypeError: If the response is not in the expected format
         """
-        try:
-            response = self._make_request('POST', '/system/resource/print', {})
-            
-            if isinstance(response, list):
-                return response
-            elif isinstance(response, dict) and 'ret' in response:
-                return response['ret']
-            else:
-                self._log_warning(f"Unexpected response type: {type(response).__name__}")
-                return []
-        except (requests.RequestException, ValueError, TypeError) as e:
-            self._log_error(f"Error fetching system resources: {str(e)}")
-            raise
+        response = await self._fetch_resources()
+        
+        if isinstance(response, list):
+            return response
+        elif isinstance(response, dict) and 'ret' in response:
+            # Older wrapped response shape, kept for compatibility
+            return response['ret']
+        else:
+            self._log_warning(f"Unexpected response type: {type(response).__name__}")
+            return []
+    
+    async def _fetch_resources(self) -> Any:
+        """Fetch /system/resource, reusing a response younger than SYSTEM_RESOURCE_CACHE_TTL."""
+        return await self._cached_request('POST', '/system/resource/print', {},
+                                          ttl=SYSTEM_RESOURCE_CACHE_TTL)
     
     async def get_system_health(self) -> Dict[str, Any]:
         """
@@ -90,55 +110,57 @@ class MikroTikSystemClient(MikroTikBaseClient):
             Dictionary containing system health metrics
             
         Raises:
-            requests.ConnectionError: If there's a connection error
-            requests.Timeout: If the request times out
-            requests.HTTPError: If the API returns an HTTP error status
-            requests.RequestException: For other request-related errors
+            aiohttp.ClientConnectionError: If there's a connection error
+            asyncio.TimeoutError: If the request times out
+            aiohttp.ClientResponseError: If the API returns an HTTP error status
+            aiohttp.ClientError: For other request-related errors
             ValueError: For invalid response data
             TypeError: If the response is not in the expected format
         """
         try:
-            system_info = await self.get_system_info()
+            response = await self.get_system_info()
+        except Exception as e:
+            # get_system_info has already logged request errors
+            if not isinstance(e, TRANSPORT_ERRORS):
+                self._log_error(f"Error calculating system health: {str(e)}")
+            return {"status": "error", "error": str(e)}
+        
+        try:
+            if not response:
+                return dict(_EMPTY_HEALTH)
             
-            if not system_info:
-                return {"status": "unknown", "error": "No system information available"}
+            system_info = SystemInfo.from_dict(response)
+            free_memory = system_info.free_memory or 0
+            free_hdd_space = system_info.free_hdd_space or 0
             
             # Calculate health metrics
-            memory_usage = 0
-            if system_info.get('total_memory') and system_info.get('free_memory'):
-                memory_usage = ((system_info['total_memory'] - system_info['free_memory']) / 
-                               system_info['total_memory']) * 100
-            
-            disk_usage = 0
-            if system_info.get('total_hdd_space') and system_info.get('free_hdd_space'):
-                disk_usage = ((system_info['total_hdd_space'] - system_info['free_hdd_space']) / 
-                             system_info['total_hdd_space']) * 100
-            
-            # Determine overall health status
-            status = "healthy"
-            if memory_usage > 90 or disk_usage > 90:
-                status = "critical"
-            elif memory_usage > 80 or disk_usage > 80:
-                status = "warning"
-            elif memory_usage > 70 or disk_usage > 70:
-                status = "attention"
+            memory_usage = self._usage_percent(system_info.total_memory, free_memory)
+            disk_usage = self._usage_percent(system_info.total_hdd_space, free_hdd_space)
             
             return {
                 "status": self._determine_health_status(memory_usage, disk_usage),
-                "uptime": system_info.get('uptime'),
-                "version": system_info.get('version'),
-                "cpu_load": system_info.get('cpu_load'),
+                "uptime": system_info.uptime,
+                "version": system_info.version,
+                "cpu_load": system_info.cpu_load,
                 "memory_usage_percent": round(memory_usage, 2),
                 "disk_usage_percent": round(disk_usage, 2),
-                "free_memory_mb": round(system_info.get('free_memory', 0) / (1024 * 1024), 2),
-                "free_disk_mb": round(system_info.get('free_hdd_space', 0) / (1024 * 1024), 2)
+                "free_memory_mb": round(free_memory * _INV_MIB, 2),
+                "free_disk_mb": round(free_hdd_space * _INV_MIB, 2)
             }
             
         except Exception as e:
             self._log_error(f"Error calculating system health: {str(e)}")
             return {"status": "error", "error": str(e)}
     
-    def _determine_health_status(self, memory_usage: float, disk_usage: float) -> str:
+    @staticmethod
+    def _usage_percent(total: Optional[int], free: Optional[int]) -> float:
+        """Return the used share of total as a percentage (0 if either value is missing)."""
+        if not total or not free:
+            return 0.0
+        return (total - free) / total * 100
+    
+    @staticmethod
+    def _determine_health_status(memory_usage: float, disk_usage: float) -> str:
         """
         Determine overall health status based on resource usage.
         
@@ -149,11 +171,5 @@ class MikroTikSystemClient(MikroTikBaseClient):
         Returns:
             Health status string
         """
-        if memory_usage > 90 or disk_usage > 90:
-            return "critical"
-        elif memory_usage > 80 or disk_usage > 80:
-            return "warning"
-        elif memory_usage > 70 or disk_usage > 70:
-            return "attention"
-        else:
-            return "healthy"
+        # bisect_left so that a value equal to a threshold stays in the lower status
+        return _HEALTH_STATUS[bisect_left(_HEALTH_THRESHOLDS, max(memory_usage, disk_usage))]
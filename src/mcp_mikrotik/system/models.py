@@ -3,7 +3,8 @@ MikroTik System Type Definitions
 
 This module contains type definitions for system-related operations in the MikroTik API.
 """
-from typing import TypedDict, Optional, Any
+from dataclasses import dataclass, fields
+from typing import Any, List, Mapping, Optional, TypedDict
 
 
 class MikroTikSystemInfo(TypedDict, total=False):
@@ -26,10 +27,35 @@ class MikroTikSystemInfo(TypedDict, total=False):
     platform: str  # Hardware platform
 
 
-class MikroTikResourceInfo(TypedDict, total=False):
+# Response of the /system/resource/print endpoint (an array, not wrapped in 'ret')
+MikroTikResourceInfo = List[MikroTikSystemInfo]
+
+
+@dataclass(slots=True)
+class SystemInfo:
     """
-    MikroTik resource information structure.
+    In-process form of MikroTikSystemInfo with slotted attribute access.
     
-    Based on MikroTik RouterOS API documentation for /system/resource/print endpoint.
+    MikroTikSystemInfo stays the type of API responses and public return
+    values; this class is for code that reads the fields repeatedly.
     """
-    ret: list[MikroTikSystemInfo]  # List of system info entries
+    uptime: Optional[str] = None
+    version: Optional[str] = None
+    board_name: Optional[str] = None
+    cpu_count: Optional[int] = None
+    cpu_frequency: Optional[int] = None
+    cpu_load: Optional[int] = None
+    free_hdd_space: Optional[int] = None
+    total_hdd_space: Optional[int] = None
+    free_memory: Optional[int] = None
+    total_memory: Optional[int] = None
+    architecture_name: Optional[str] = None
+    platform: Optional[str] = None
+    
+    @classmethod
+    def from_dict(cls, info: Mapping[str, Any]) -> "SystemInfo":
+        """Build from a system info dictionary, ignoring unknown keys."""
+        return cls(**{name: info[name] for name in _SYSTEM_INFO_FIELDS if name in info})
+
+
+_SYSTEM_INFO_FIELDS = tuple(field.name for field in fields(SystemInfo))
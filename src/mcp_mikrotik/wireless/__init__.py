@@ -11,8 +11,14 @@ This module provides specialized client functionality for MikroTik wireless mana
 # - /interface/wireless/sniffer/print - Wireless sniffer configuration
 # - Wireless security and authentication settings
 
-from .client import MikroTikWirelessClient
-
 __all__ = [
     "MikroTikWirelessClient"
 ]
+
+
+def __getattr__(name):
+    # Import the client on first use so importing the package stays cheap
+    if name == "MikroTikWirelessClient":
+        from .client import MikroTikWirelessClient
+        return MikroTikWirelessClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,17 +2,36 @@
 Pytest configuration and fixtures for MikroTik MCP tests.
 """
 import pytest
-import sys
-import os
+import pytest_asyncio
 from unittest.mock import Mock, AsyncMock
 
-# Add the project root to the Python path
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root)
-
 from src.mcp_mikrotik import MikroTikClient
 from src.mcp_mikrotik.models import MikroTikConfig
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+if uvloop is not None:
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """Run the async tests on uvloop when it is installed."""
+        return {"uvloop": uvloop.new_event_loop}
+
+
+# One AsyncMock reused by every test: creating one costs a few hundred
+# microseconds, resetting it only a few
+_ASYNC_MOCK = AsyncMock()
+
+
+@pytest.fixture
+def async_mock():
+    """Provide a freshly reset AsyncMock (no calls, return value or side effect)."""
+    _ASYNC_MOCK.reset_mock(return_value=True, side_effect=True)
+    return _ASYNC_MOCK
+
 
 @pytest.fixture
 def mock_config():
@@ -26,6 +45,71 @@ def mock_config():
     }
 
 
+@pytest.fixture(scope="session")
+def mikrotik_config():
+    """Provide the device configuration shared by the client tests (read-only)."""
+    return {
+        "host": "192.168.88.1",
+        "username": "admin",
+        "password": "password",
+        "port": 443,
+        "useSSL": True
+    }
+
+
+@pytest_asyncio.fixture(scope="session")
+async def all_tools():
+    """Provide the server's tool list, fetched once per session (read-only)."""
+    from server.server import handle_list_tools
+    return await handle_list_tools()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def all_resources():
+    """Provide the server's resource list, fetched once per session (read-only)."""
+    from server.server import handle_list_resources
+    return await handle_list_resources()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def all_prompts():
+    """Provide the server's prompt list, fetched once per session (read-only)."""
+    from server.server import handle_list_prompts
+    return await handle_list_prompts()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def lifespan_context():
+    """Enter the server lifespan once per session and provide its context."""
+    from server.server import server, server_lifespan
+    async with server_lifespan(server) as context:
+        yield context
+
+
+@pytest.fixture(scope="session")
+def tools_by_name(all_tools):
+    """Index the server's tools by name."""
+    return {tool.name: tool for tool in all_tools}
+
+
+@pytest.fixture(scope="session")
+def resources_by_name(all_resources):
+    """Index the server's resources by name."""
+    return {resource.name: resource for resource in all_resources}
+
+
+@pytest.fixture(scope="session")
+def resources_by_uri(all_resources):
+    """Index the server's resources by URI."""
+    return {str(resource.uri): resource for resource in all_resources}
+
+
+@pytest.fixture(scope="session")
+def prompts_by_name(all_prompts):
+    """Index the server's prompts by name."""
+    return {prompt.name: prompt for prompt in all_prompts}
+
+
 @pytest.fixture
 def mock_mikrotik_client(mock_config):
     """Provide a mock MikroTik client for testing."""
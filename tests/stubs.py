@@ -0,0 +1,20 @@
+"""
+Lightweight awaitable stubs for MikroTik client tests.
+
+These replace ``AsyncMock`` where a test only needs a coroutine to return a
+value or raise, and never inspects how it was called.
+"""
+
+
+def async_return(value):
+    """Return a coroutine function that ignores its arguments and returns value."""
+    async def _stub(*args, **kwargs):
+        return value
+    return _stub
+
+
+def async_raise(exc):
+    """Return a coroutine function that ignores its arguments and raises exc."""
+    async def _stub(*args, **kwargs):
+        raise exc
+    return _stub
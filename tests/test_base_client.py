@@ -0,0 +1,127 @@
+"""
+Tests for MikroTik Base Client
+
+This module contains tests for the shared request helpers of the base client.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import aiohttp
+import pytest
+from unittest.mock import Mock, patch
+from src.mcp_mikrotik.base import MikroTikBaseClient
+
+
+@pytest.fixture
+def base_client(mikrotik_config):
+    """Create a MikroTik base client for testing."""
+    return MikroTikBaseClient(mikrotik_config)
+
+
+class TestMikroTikBaseClient:
+    """Test cases for MikroTik base client."""
+    
+    async def test_batch_returns_results_in_order(self, base_client):
+        """Test that batch returns one normalized result per operation, in order."""
+        responses = {
+            '/ip/pool': [{"name": "lan-pool"}],
+            '/ip/address/print': {"ret": [{"address": "192.168.88.1/24"}]},
+        }
+        
+        def fake_request(method, endpoint, data=None):
+            return responses[endpoint]
+        
+        with patch.object(base_client, '_make_request', side_effect=fake_request):
+            result = await base_client.batch([
+                ('/ip/pool/print', None),
+                ('/ip/address/print', {"interface": "bridge"}),
+            ])
+            
+            assert result == [
+                [{"name": "lan-pool"}],
+                [{"address": "192.168.88.1/24"}],
+            ]
+    
+    async def test_batch_propagates_errors(self, base_client):
+        """Test that a failing operation makes the whole batch fail."""
+        with patch.object(base_client, '_make_request', side_effect=aiohttp.ClientConnectionError("Connection failed")):
+            with patch.object(base_client, '_log_error') as mock_error:
+                with pytest.raises(aiohttp.ClientConnectionError, match="Connection failed"):
+                    await base_client.batch([('/ip/pool/print', None)])
+                
+                mock_error.assert_called_once_with("Error running batch: Connection failed")
+    
+    async def test_batch_empty(self, base_client):
+        """Test that an empty batch returns an empty list."""
+        assert await base_client.batch([]) == []
+    
+    async def test_print_coalesces_concurrent_identical_requests(self, base_client):
+        """Test that concurrent identical prints share a single request."""
+        with patch.object(base_client, '_make_request', return_value=[{"name": "ether1"}]) as mock_request:
+            first, second = await asyncio.gather(
+                base_client._print('/interface/print'),
+                base_client._print('/interface/print'),
+            )
+            
+            assert first == second == [{"name": "ether1"}]
+            mock_request.assert_called_once()
+            assert base_client._inflight == {}
+    
+    async def test_print_does_not_coalesce_different_bodies(self, base_client):
+        """Test that prints with different filters are sent separately."""
+        with patch.object(base_client, '_make_request', return_value=[]) as mock_request:
+            await asyncio.gather(
+                base_client._print('/interface/print', {"name": "ether1"}),
+                base_client._print('/interface/print', {"name": "ether2"}),
+            )
+            
+            assert mock_request.call_count == 2
+    
+    async def test_print_sequential_requests_are_not_cached(self, base_client):
+        """Test that a completed request is not reused by later callers."""
+        with patch.object(base_client, '_make_request', return_value=[]) as mock_request:
+            await base_client._print('/interface/print')
+            await base_client._print('/interface/print')
+            
+            assert mock_request.call_count == 2
+    
+    async def test_make_request_limits_concurrency(self):
+        """Test that concurrent requests to one device are capped."""
+        client = MikroTikBaseClient({
+            "host": "10.0.0.99",
+            "username": "admin",
+            "password": "password"
+        }, max_concurrent_requests=2)
+        active = peak = 0
+        
+        class FakeResponse:
+            status = 200
+            reason = "OK"
+            
+            async def read(self):
+                return b"[]"
+        
+        @asynccontextmanager
+        async def fake_request(method, url, **kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            try:
+                await asyncio.sleep(0.01)
+                yield FakeResponse()
+            finally:
+                active -= 1
+        
+        session = Mock()
+        session.request = fake_request
+        with patch.object(client, '_get_session', return_value=session):
+            await asyncio.gather(*(client._make_request('GET', f'/ip/pool/*{i}') for i in range(6)))
+        
+        assert peak == 2
+    
+    async def test_semaphore_shared_per_device(self, base_client):
+        """Test that clients of the same device share one concurrency limit."""
+        other = MikroTikBaseClient(base_client.config)
+        
+        assert base_client._get_semaphore() is other._get_semaphore()
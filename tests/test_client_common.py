@@ -0,0 +1,170 @@
+"""
+Tests shared by the MikroTik print-style clients
+
+This module runs the request contract common to the DHCP, firewall and
+interface clients (response shapes, errors and request body building) once
+per client, driven by a table of client specs.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from unittest.mock import Mock
+from tests.stubs import async_raise, async_return
+from src.mcp_mikrotik.dhcp.client import MikroTikDHCPClient
+from src.mcp_mikrotik.dhcp.models import GetDHCPServersArgs
+from src.mcp_mikrotik.firewall.client import MikroTikFirewallClient
+from src.mcp_mikrotik.firewall.models import GetFirewallRulesArgs
+from src.mcp_mikrotik.interface.client import MikroTikInterfaceClient
+from src.mcp_mikrotik.interface.models import GetInterfacesArgs
+
+
+@dataclass(frozen=True)
+class ClientSpec:
+    """Describes one client's main getter and its request body builder."""
+    name: str
+    client_class: type
+    method_name: str
+    builder_name: str
+    options_class: type
+    partial_options: Dict[str, Any]
+    partial_body: Dict[str, Any]
+    none_options: Dict[str, Any]
+    sample: List[Dict[str, Any]]
+
+
+CLIENT_SPECS = [
+    ClientSpec(
+        name="dhcp",
+        client_class=MikroTikDHCPClient,
+        method_name="get_dhcp_servers",
+        builder_name="_build_dhcp_servers_request_body",
+        options_class=GetDHCPServersArgs,
+        partial_options={"name": "main-pool"},
+        partial_body={"name": "main-pool"},
+        none_options={"name": "main-pool", "interface": None, "address_pool": None},
+        sample=[{"name": "main-pool", "interface": "ether2"}, {"name": "guest-pool", "interface": "ether3"}],
+    ),
+    ClientSpec(
+        name="firewall",
+        client_class=MikroTikFirewallClient,
+        method_name="get_firewall_rules",
+        builder_name="_build_firewall_rules_request_body",
+        options_class=GetFirewallRulesArgs,
+        partial_options={"chain": "input"},
+        partial_body={"chain": "input"},
+        none_options={"chain": "input", "action": None, "src_address": None},
+        sample=[{"chain": "input", "action": "accept"}, {"chain": "forward", "action": "accept"}],
+    ),
+    ClientSpec(
+        name="interface",
+        client_class=MikroTikInterfaceClient,
+        method_name="get_interfaces",
+        builder_name="_build_interfaces_request_body",
+        options_class=GetInterfacesArgs,
+        partial_options={"name": "ether1"},
+        partial_body={"name": "ether1"},
+        none_options={"name": "ether1", "type": None, "disabled": None},
+        sample=[{"name": "ether1", "type": "ether"}, {"name": "ether2", "type": "ether"}],
+    ),
+]
+
+
+@pytest.fixture(params=CLIENT_SPECS, ids=lambda spec: spec.name)
+def spec(request):
+    """Provide each client spec in turn."""
+    return request.param
+
+
+@pytest.fixture
+def client(spec, mock_config):
+    """Create the client described by the current spec."""
+    return spec.client_class(mock_config)
+
+
+class TestClientContract:
+    """Test cases shared by the DHCP, firewall and interface clients."""
+    
+    async def test_get_with_options(self, spec, client):
+        """Test that options are passed to the request body builder."""
+        options = spec.options_class(**spec.partial_options)
+        
+        client._make_request = async_return(spec.sample)
+        mock_builder = Mock(return_value=spec.partial_body)
+        setattr(client, spec.builder_name, mock_builder)
+        result = await getattr(client, spec.method_name)(options)
+        
+        assert result is spec.sample
+        # Verify options were passed to request builder
+        mock_builder.assert_called_once_with(options)
+    
+    @pytest.mark.parametrize("shape", ["list", "ret", "unexpected"])
+    async def test_get_response_shapes(self, spec, client, shape):
+        """Test handling of list, dict with 'ret' key and unexpected responses."""
+        response = {"list": spec.sample, "ret": {"ret": spec.sample}, "unexpected": "unexpected"}[shape]
+        unexpected = shape == "unexpected"
+        
+        client._make_request = async_return(response)
+        mock_warning = client._log_warning = Mock()
+        result = await getattr(client, spec.method_name)()
+        
+        if unexpected:
+            assert result == []
+        else:
+            assert result is spec.sample
+        assert mock_warning.call_count == unexpected
+    
+    async def test_get_request_error(self, spec, client):
+        """Test that request errors are logged once and re-raised."""
+        client._make_request = async_raise(aiohttp.ClientConnectionError("Connection error"))
+        mock_error = client._log_error = Mock()
+        with pytest.raises(aiohttp.ClientConnectionError, match="Connection error"):
+            await getattr(client, spec.method_name)()
+        
+        mock_error.assert_called_once()
+        assert "Connection error" in mock_error.call_args.args[0]
+    
+    async def test_get_http_error_logged_once(self, spec, mock_config):
+        """Test that an HTTP error status from the device is logged once."""
+        async def internal_error(request):
+            return web.Response(status=500, text="failure")
+        
+        app = web.Application()
+        app.router.add_route('*', '/{path:.*}', internal_error)
+        async with TestServer(app, host='127.0.0.1') as server:
+            config = {**mock_config, "host": "127.0.0.1", "port": server.port, "useSSL": False}
+            async with spec.client_class(config) as http_client:
+                mock_error = http_client._log_error = Mock()
+                with pytest.raises(aiohttp.ClientResponseError):
+                    await getattr(http_client, spec.method_name)()
+        
+        mock_error.assert_called_once()
+        assert "status 500 - Details: failure" in mock_error.call_args.args[0]
+    
+    def test_build_request_body_partial(self, spec, client):
+        """Test building request body with partial options."""
+        options = spec.options_class(**spec.partial_options)
+        
+        result = getattr(client, spec.builder_name)(options)
+        
+        assert result == spec.partial_body
+    
+    def test_build_request_body_none_values(self, spec, client):
+        """Test building request body with None values."""
+        options = spec.options_class(**spec.none_options)
+        
+        result = getattr(client, spec.builder_name)(options)
+        
+        assert result == spec.partial_body
+    
+    def test_build_request_body_empty(self, spec, client):
+        """Test building request body with empty options."""
+        options = spec.options_class()
+        
+        result = getattr(client, spec.builder_name)(options)
+        
+        assert result == {}
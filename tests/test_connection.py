@@ -6,13 +6,9 @@ This test validates the MikroTik client connection logic.
 Set RUN_INTEGRATION_TESTS=1 to run against real hardware.
 """
 import os
-import sys
 import pytest
 from unittest.mock import Mock, patch
 
-# Add parent directory to path to import from client
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 # Skip this integration test unless explicitly enabled
 pytestmark = pytest.mark.skipif(
     os.environ.get("RUN_INTEGRATION_TESTS") != "1",
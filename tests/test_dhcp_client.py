@@ -5,151 +5,129 @@ This module contains tests for the MikroTik DHCP management functionality.
 """
 
 import pytest
-from unittest.mock import patch, AsyncMock
+from tests.stubs import async_return
 from src.mcp_mikrotik.dhcp.client import MikroTikDHCPClient
 from src.mcp_mikrotik.dhcp.models import MikroTikDHCPServer, MikroTikDHCPLease, GetDHCPServersArgs
 
 
-@pytest.fixture
-def dhcp_client():
-    """Create a MikroTik DHCP client for testing."""
-    config = {
-        "host": "192.168.88.1",
-        "username": "admin",
-        "password": "password",
-        "port": 443,
-        "useSSL": True
+# Sample API responses; tests only read them, so one copy is shared
+_SAMPLE_DHCP_SERVERS = [
+    {
+        "name": "main-pool",
+        "interface": "ether2",
+        "address_pool": "lan-pool",
+        "lease_time": "3d",
+        "disabled": False,
+        "authoritative": True,
+        "comment": "Main LAN DHCP Server"
+    },
+    {
+        "name": "guest-pool",
+        "interface": "ether3",
+        "address_pool": "guest-pool",
+        "lease_time": "1h",
+        "disabled": False,
+        "authoritative": True,
+        "comment": "Guest Network DHCP Server"
+    }
+]
+
+
+_SAMPLE_DHCP_LEASES = [
+    {
+        "address": "192.168.88.100",
+        "mac_address": "00:0C:29:XX:XX:XX",
+        "client_id": "client1",
+        "host_name": "laptop-01",
+        "active_address": "192.168.88.100",
+        "active_mac_address": "00:0C:29:XX:XX:XX",
+        "active_server": "main-pool",
+        "expires_after": "2d",
+        "comment": "Laptop User"
+    },
+    {
+        "address": "192.168.88.101",
+        "mac_address": "00:0C:29:YY:YY:YY",
+        "client_id": "client2",
+        "host_name": "desktop-01",
+        "active_address": "192.168.88.101",
+        "active_mac_address": "00:0C:29:YY:YY:YY",
+        "active_server": "main-pool",
+        "expires_after": "2d",
+        "comment": "Desktop User"
     }
-    return MikroTikDHCPClient(config)
+]
+
+
+# Full options and the API request body they map to
+_FULL_DHCP_SERVERS_ARGS = GetDHCPServersArgs(
+    name="main-pool",
+    interface="ether2",
+    address_pool="lan-pool",
+    disabled=False,
+    comment="Test Server"
+)
+
+_FULL_DHCP_SERVERS_BODY = {
+    "name": "main-pool",
+    "interface": "ether2",
+    "address-pool": "lan-pool",
+    "disabled": False,
+    "comment": "Test Server"
+}
 
 
 @pytest.fixture
+def dhcp_client(mikrotik_config):
+    """Create a MikroTik DHCP client for testing."""
+    return MikroTikDHCPClient(mikrotik_config)
+
+
+@pytest.fixture(scope="module")
 def sample_dhcp_servers():
     """Sample DHCP servers data for testing."""
-    return [
-        {
-            "name": "main-pool",
-            "interface": "ether2",
-            "address_pool": "lan-pool",
-            "lease_time": "3d",
-            "disabled": False,
-            "authoritative": True,
-            "comment": "Main LAN DHCP Server"
-        },
-        {
-            "name": "guest-pool",
-            "interface": "ether3",
-            "address_pool": "guest-pool",
-            "lease_time": "1h",
-            "disabled": False,
-            "authoritative": True,
-            "comment": "Guest Network DHCP Server"
-        }
-    ]
+    return _SAMPLE_DHCP_SERVERS
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_dhcp_leases():
     """Sample DHCP leases data for testing."""
-    return [
-        {
-            "address": "192.168.88.100",
-            "mac_address": "00:0C:29:XX:XX:XX",
-            "client_id": "client1",
-            "host_name": "laptop-01",
-            "active_address": "192.168.88.100",
-            "active_mac_address": "00:0C:29:XX:XX:XX",
-            "active_server": "main-pool",
-            "expires_after": "2d",
-            "comment": "Laptop User"
-        },
-        {
-            "address": "192.168.88.101",
-            "mac_address": "00:0C:29:YY:YY:YY",
-            "client_id": "client2",
-            "host_name": "desktop-01",
-            "active_address": "192.168.88.101",
-            "active_mac_address": "00:0C:29:YY:YY:YY",
-            "active_server": "main-pool",
-            "expires_after": "2d",
-            "comment": "Desktop User"
-        }
-    ]
+    return _SAMPLE_DHCP_LEASES
 
 
 class TestMikroTikDHCPClient:
     """Test cases for MikroTik DHCP client."""
     
-    @pytest.mark.asyncio
     async def test_get_dhcp_servers_success(self, dhcp_client, sample_dhcp_servers):
         """Test successful DHCP servers retrieval."""
-        with patch.object(dhcp_client, '_make_request', return_value=sample_dhcp_servers):
-            result = await dhcp_client.get_dhcp_servers()
-            
-            assert result == sample_dhcp_servers
-            assert len(result) == 2
-            assert result[0]["name"] == "main-pool"
-            assert result[1]["name"] == "guest-pool"
-    
-    @pytest.mark.asyncio
-    async def test_get_dhcp_servers_with_options(self, dhcp_client, sample_dhcp_servers):
-        """Test DHCP servers retrieval with filtering options."""
-        options = GetDHCPServersArgs(name="main-pool", disabled=False)
+        dhcp_client._make_request = async_return(sample_dhcp_servers)
+        result = await dhcp_client.get_dhcp_servers()
         
-        with patch.object(dhcp_client, '_make_request', return_value=sample_dhcp_servers):
-            with patch.object(dhcp_client, '_build_dhcp_servers_request_body') as mock_builder:
-                mock_builder.return_value = {"name": "main-pool"}
-                result = await dhcp_client.get_dhcp_servers(options)
-                
-                assert result == sample_dhcp_servers
-                # Verify options were passed to request builder
-                mock_builder.assert_called_once_with(options)
+        assert result is sample_dhcp_servers
     
-    @pytest.mark.asyncio
-    async def test_get_dhcp_servers_dict_response(self, dhcp_client, sample_dhcp_servers):
-        """Test handling of dict response with 'ret' key."""
-        response = {"ret": sample_dhcp_servers}
+    async def test_get_dhcp_leases_success(self, dhcp_client, sample_dhcp_leases):
+        """Test successful DHCP leases retrieval."""
+        dhcp_client._make_request = async_return(sample_dhcp_leases)
+        result = await dhcp_client.get_dhcp_leases()
         
-        with patch.object(dhcp_client, '_make_request', return_value=response):
-            result = await dhcp_client.get_dhcp_servers()
-            
-            assert result == sample_dhcp_servers
-            assert len(result) == 2
+        assert result is sample_dhcp_leases
     
-    @pytest.mark.asyncio
-    async def test_get_dhcp_servers_unexpected_response(self, dhcp_client):
-        """Test handling of unexpected response format."""
-        response = "unexpected"
+    async def test_get_dhcp_leases_uses_get_without_filters(self, dhcp_client, sample_dhcp_leases, async_mock):
+        """Test that unfiltered prints are sent as a GET on the menu path."""
+        dhcp_client._make_request = async_mock
+        async_mock.return_value = sample_dhcp_leases
+        await dhcp_client.get_dhcp_leases()
         
-        with patch.object(dhcp_client, '_make_request', return_value=response):
-            with patch.object(dhcp_client, '_log_warning') as mock_warning:
-                result = await dhcp_client.get_dhcp_servers()
-                
-                assert result == []
-                mock_warning.assert_called_once()
+        async_mock.assert_called_once_with('GET', '/ip/dhcp-server/lease')
     
-    @pytest.mark.asyncio
-    async def test_get_dhcp_servers_request_error(self, dhcp_client):
-        """Test handling of request errors."""
-        with patch.object(dhcp_client, '_make_request', side_effect=Exception("Connection error")):
-            with patch.object(dhcp_client, '_log_error') as mock_error:
-                with pytest.raises(Exception):
-                    await dhcp_client.get_dhcp_servers()
-                
-                mock_error.assert_called_once()
-    
-    @pytest.mark.asyncio
-    async def test_get_dhcp_leases_success(self, dhcp_client, sample_dhcp_leases):
-        """Test successful DHCP leases retrieval."""
-        with patch.object(dhcp_client, '_make_request', return_value=sample_dhcp_leases):
-            result = await dhcp_client.get_dhcp_leases()
-            
-            assert result == sample_dhcp_leases
-            assert len(result) == 2
-            assert result[0]["address"] == "192.168.88.100"
-            assert result[1]["address"] == "192.168.88.101"
+    async def test_get_dhcp_servers_uses_post_with_filters(self, dhcp_client, sample_dhcp_servers, async_mock):
+        """Test that filtered prints keep using POST with a request body."""
+        dhcp_client._make_request = async_mock
+        async_mock.return_value = sample_dhcp_servers
+        await dhcp_client.get_dhcp_servers({"name": "main-pool"})
+        
+        async_mock.assert_called_once_with('POST', '/ip/dhcp-server/print', {"name": "main-pool"})
     
-    @pytest.mark.asyncio
     async def test_get_dhcp_networks_success(self, dhcp_client):
         """Test successful DHCP networks retrieval."""
         sample_networks = [
@@ -157,13 +135,11 @@ class TestMikroTikDHCPClient:
             {"name": "guest-network", "address": "192.168.89.0/24", "gateway": "192.168.89.1"}
         ]
         
-        with patch.object(dhcp_client, '_make_request', return_value=sample_networks):
-            result = await dhcp_client.get_dhcp_networks()
-            
-            assert result == sample_networks
-            assert len(result) == 2
+        dhcp_client._make_request = async_return(sample_networks)
+        result = await dhcp_client.get_dhcp_networks()
+        
+        assert result is sample_networks
     
-    @pytest.mark.asyncio
     async def test_get_dhcp_clients_success(self, dhcp_client):
         """Test successful DHCP clients retrieval."""
         sample_clients = [
@@ -171,60 +147,15 @@ class TestMikroTikDHCPClient:
             {"interface": "ether3", "disabled": False, "comment": "Guest DHCP Client"}
         ]
         
-        with patch.object(dhcp_client, '_make_request', return_value=sample_clients):
-            result = await dhcp_client.get_dhcp_clients()
-            
-            assert result == sample_clients
-            assert len(result) == 2
+        dhcp_client._make_request = async_return(sample_clients)
+        result = await dhcp_client.get_dhcp_clients()
+        
+        assert result is sample_clients
     
     def test_build_dhcp_servers_request_body(self, dhcp_client):
         """Test building request body for DHCP servers API calls."""
-        options = GetDHCPServersArgs(
-            name="main-pool",
-            interface="ether2",
-            address_pool="lan-pool",
-            disabled=False,
-            comment="Test Server"
-        )
-        
-        result = dhcp_client._build_dhcp_servers_request_body(options)
-        
-        expected = {
-            "name": "main-pool",
-            "interface": "ether2",
-            "address-pool": "lan-pool",
-            "disabled": False,
-            "comment": "Test Server"
-        }
-        
-        assert result == expected
-    
-    def test_build_dhcp_servers_request_body_partial(self, dhcp_client):
-        """Test building request body with partial options."""
-        options = GetDHCPServersArgs(name="main-pool")
-        
-        result = dhcp_client._build_dhcp_servers_request_body(options)
-        
-        expected = {"name": "main-pool"}
-        assert result == expected
-    
-    def test_build_dhcp_servers_request_body_none_values(self, dhcp_client):
-        """Test building request body with None values."""
-        options = GetDHCPServersArgs(
-            name="main-pool",
-            interface=None,
-            address_pool=None
-        )
-        
-        result = dhcp_client._build_dhcp_servers_request_body(options)
-        
-        expected = {"name": "main-pool"}
-        assert result == expected
-    
-    def test_build_dhcp_servers_request_body_empty(self, dhcp_client):
-        """Test building request body with empty options."""
-        options = GetDHCPServersArgs()
+        options = _FULL_DHCP_SERVERS_ARGS
         
         result = dhcp_client._build_dhcp_servers_request_body(options)
         
-        assert result == {}
+        assert result == _FULL_DHCP_SERVERS_BODY
@@ -4,249 +4,246 @@ Tests for MikroTik IP Client
 This module tests the IP client functionality including IP address management,
 routing, and network configuration.
 """
+import aiohttp
 import pytest
-from unittest.mock import Mock, patch, AsyncMock
-import sys
-import os
-
-# Add the project root to the Python path
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root)
+from unittest.mock import patch
+from tests.stubs import async_raise, async_return
 
+from src.mcp_mikrotik.client import MikroTikClient
 from src.mcp_mikrotik.ip.client import MikroTikIPClient
 from src.mcp_mikrotik.ip.models import GetIPAddressesArgs, GetIPRoutesArgs
 
 
+# Sample API responses; tests only read them, so one copy is shared
+_SAMPLE_IP_ADDRESSES = [
+    {
+        "address": "192.168.1.1/24",
+        "network": "192.168.1.0",
+        "interface": "ether1",
+        "comment": "LAN interface"
+    },
+    {
+        "address": "10.0.0.1/24",
+        "network": "10.0.0.0",
+        "interface": "ether2",
+        "comment": "WAN interface"
+    }
+]
+
+
+_SAMPLE_IP_ROUTES = [
+    {
+        "dst_address": "0.0.0.0/0",
+        "gateway": "10.0.0.1",
+        "distance": 1,
+        "comment": "Default route"
+    },
+    {
+        "dst_address": "192.168.1.0/24",
+        "gateway": "0.0.0.0",
+        "distance": 0,
+        "comment": "Local network"
+    }
+]
+
+
+_SAMPLE_IP_POOLS = [
+    {
+        "name": "lan_pool",
+        "ranges": "192.168.1.10-192.168.1.100",
+        "comment": "LAN DHCP pool"
+    },
+    {
+        "name": "guest_pool",
+        "ranges": "192.168.2.10-192.168.2.50",
+        "comment": "Guest network pool"
+    }
+]
+
+
 class TestMikroTikIPClient:
     """Test cases for MikroTikIPClient."""
     
+    # Function scoped: the client caches responses (see the get_ip_pools cache tests)
     @pytest.fixture
-    def client(self):
+    def client(self, mikrotik_config):
         """Create an IP client instance for testing."""
-        config = {
-            "host": "192.168.1.1",
-            "username": "admin",
-            "password": "test_password",
-            "port": 443,
-            "useSSL": True
-        }
-        return MikroTikIPClient(config)
-    
-    @pytest.fixture
-    def sample_ip_addresses(self):
-        """Sample IP addresses for testing."""
-        return [
-            {
-                "address": "192.168.1.1/24",
-                "network": "192.168.1.0",
-                "interface": "ether1",
-                "comment": "LAN interface"
-            },
-            {
-                "address": "10.0.0.1/24",
-                "network": "10.0.0.0",
-                "interface": "ether2",
-                "comment": "WAN interface"
-            }
-        ]
-    
-    @pytest.fixture
-    def sample_ip_routes(self):
-        """Sample IP routes for testing."""
-        return [
-            {
-                "dst_address": "0.0.0.0/0",
-                "gateway": "10.0.0.1",
-                "distance": 1,
-                "comment": "Default route"
-            },
-            {
-                "dst_address": "192.168.1.0/24",
-                "gateway": "0.0.0.0",
-                "distance": 0,
-                "comment": "Local network"
-            }
-        ]
+        return MikroTikIPClient(mikrotik_config)
     
     @pytest.fixture
-    def sample_ip_pools(self):
-        """Sample IP pools for testing."""
-        return [
-            {
-                "name": "lan_pool",
-                "ranges": "192.168.1.10-192.168.1.100",
-                "comment": "LAN DHCP pool"
-            },
-            {
-                "name": "guest_pool",
-                "ranges": "192.168.2.10-192.168.2.50",
-                "comment": "Guest network pool"
-            }
-        ]
+    def request_mock(self, client, monkeypatch, async_mock):
+        """Stub the client's _make_request with the shared AsyncMock for one test."""
+        monkeypatch.setattr(client, '_make_request', async_mock)
+        return async_mock
     
-    @pytest.mark.asyncio
-    async def test_get_ip_addresses_no_options(self, client, sample_ip_addresses):
-        """Test IP addresses retrieval without options."""
-        with patch.object(client, '_make_request', return_value=sample_ip_addresses):
-            result = await client.get_ip_addresses()
-            assert result == sample_ip_addresses
+    @pytest.mark.parametrize("method_name, sample", [
+        ("get_ip_addresses", _SAMPLE_IP_ADDRESSES),
+        ("get_ip_routes", _SAMPLE_IP_ROUTES),
+        ("get_ip_pools", _SAMPLE_IP_POOLS),
+    ], ids=["addresses", "routes", "pools"])
+    @pytest.mark.parametrize("shape", ["list", "ret", "unexpected", "error"])
+    async def test_getter_response_shapes(self, client, monkeypatch, method_name, sample, shape):
+        """Test list, dict with 'ret' key, unexpected and failed responses for each getter."""
+        getter = getattr(client, method_name)
+        
+        if shape == "error":
+            monkeypatch.setattr(client, '_make_request', async_raise(Exception("Request failed")))
+            with pytest.raises(Exception, match="Request failed"):
+                await getter()
+            return
+        
+        response = {"list": sample, "ret": {"ret": sample}, "unexpected": "unexpected"}[shape]
+        monkeypatch.setattr(client, '_make_request', async_return(response))
+        result = await getter()
+        assert result == ([] if shape == "unexpected" else sample)
     
-    @pytest.mark.asyncio
-    async def test_get_ip_addresses_with_interface_filter(self, client, sample_ip_addresses):
+    async def test_get_ip_addresses_with_interface_filter(self, client, monkeypatch):
         """Test IP addresses retrieval with interface filter."""
-        with patch.object(client, '_make_request', return_value=sample_ip_addresses):
-            result = await client.get_ip_addresses({"interface": "ether1"})
-            assert result == sample_ip_addresses
+        monkeypatch.setattr(client, '_make_request', async_return(_SAMPLE_IP_ADDRESSES))
+        result = await client.get_ip_addresses({"interface": "ether1"})
+        assert result == _SAMPLE_IP_ADDRESSES
     
-    @pytest.mark.asyncio
-    async def test_get_ip_addresses_with_network_filter(self, client, sample_ip_addresses):
+    async def test_get_ip_addresses_with_network_filter(self, client, monkeypatch):
         """Test IP addresses retrieval with network filter."""
-        with patch.object(client, '_make_request', return_value=sample_ip_addresses):
-            result = await client.get_ip_addresses({"network": "192.168.1.0"})
-            assert result == sample_ip_addresses
-    
-    @pytest.mark.asyncio
-    async def test_get_ip_addresses_dict_response(self, client, sample_ip_addresses):
-        """Test IP addresses retrieval with dict response containing 'ret' key."""
-        with patch.object(client, '_make_request', return_value={"ret": sample_ip_addresses}):
-            result = await client.get_ip_addresses()
-            assert result == sample_ip_addresses
+        monkeypatch.setattr(client, '_make_request', async_return(_SAMPLE_IP_ADDRESSES))
+        result = await client.get_ip_addresses({"network": "192.168.1.0"})
+        assert result == _SAMPLE_IP_ADDRESSES
     
-    @pytest.mark.asyncio
-    async def test_get_ip_addresses_unexpected_response(self, client):
-        """Test IP addresses retrieval with unexpected response type."""
-        with patch.object(client, '_make_request', return_value="unexpected"):
-            result = await client.get_ip_addresses()
-            assert result == []
-    
-    @pytest.mark.asyncio
-    async def test_get_ip_addresses_request_error(self, client):
-        """Test IP addresses retrieval with request error."""
-        with patch.object(client, '_make_request', side_effect=Exception("Request failed")):
-            with pytest.raises(Exception, match="Request failed"):
-                await client.get_ip_addresses()
-    
-    @pytest.mark.asyncio
-    async def test_get_ip_routes_no_options(self, client, sample_ip_routes):
-        """Test IP routes retrieval without options."""
-        with patch.object(client, '_make_request', return_value=sample_ip_routes):
-            result = await client.get_ip_routes()
-            assert result == sample_ip_routes
-    
-    @pytest.mark.asyncio
-    async def test_get_ip_routes_with_destination_filter(self, client, sample_ip_routes):
+    async def test_get_ip_routes_with_destination_filter(self, client, monkeypatch):
         """Test IP routes retrieval with destination address filter."""
-        with patch.object(client, '_make_request', return_value=sample_ip_routes):
-            result = await client.get_ip_routes({"dst_address": "0.0.0.0/0"})
-            assert result == sample_ip_routes
+        monkeypatch.setattr(client, '_make_request', async_return(_SAMPLE_IP_ROUTES))
+        result = await client.get_ip_routes({"dst_address": "0.0.0.0/0"})
+        assert result == _SAMPLE_IP_ROUTES
     
-    @pytest.mark.asyncio
-    async def test_get_ip_routes_with_gateway_filter(self, client, sample_ip_routes):
+    async def test_get_ip_routes_with_gateway_filter(self, client, monkeypatch):
         """Test IP routes retrieval with gateway filter."""
-        with patch.object(client, '_make_request', return_value=sample_ip_routes):
-            result = await client.get_ip_routes({"gateway": "10.0.0.1"})
-            assert result == sample_ip_routes
+        monkeypatch.setattr(client, '_make_request', async_return(_SAMPLE_IP_ROUTES))
+        result = await client.get_ip_routes({"gateway": "10.0.0.1"})
+        assert result == _SAMPLE_IP_ROUTES
     
-    @pytest.mark.asyncio
-    async def test_get_ip_routes_dict_response(self, client, sample_ip_routes):
-        """Test IP routes retrieval with dict response containing 'ret' key."""
-        with patch.object(client, '_make_request', return_value={"ret": sample_ip_routes}):
-            result = await client.get_ip_routes()
-            assert result == sample_ip_routes
+    async def test_get_ip_pools_transport_error_logged(self, client, monkeypatch):
+        """Test that transport errors are logged once and re-raised."""
+        monkeypatch.setattr(client, '_make_request', async_raise(aiohttp.ClientConnectionError("Connection refused")))
+        with patch.object(client, '_log_error') as mock_error:
+            with pytest.raises(aiohttp.ClientConnectionError):
+                await client.get_ip_pools()
+            
+            mock_error.assert_called_once_with("Error fetching IP pools: Connection refused")
     
-    @pytest.mark.asyncio
-    async def test_get_ip_routes_unexpected_response(self, client):
-        """Test IP routes retrieval with unexpected response type."""
-        with patch.object(client, '_make_request', return_value="unexpected"):
-            result = await client.get_ip_routes()
-            assert result == []
+    async def test_get_ip_pools_cached(self, client, request_mock):
+        """Test that repeated IP pool requests are served from the cache."""
+        request_mock.return_value = _SAMPLE_IP_POOLS
+        first = await client.get_ip_pools()
+        second = await client.get_ip_pools()
+        
+        assert first == second == _SAMPLE_IP_POOLS
+        request_mock.assert_called_once()
     
-    @pytest.mark.asyncio
-    async def test_get_ip_routes_request_error(self, client):
-        """Test IP routes retrieval with request error."""
-        with patch.object(client, '_make_request', side_effect=Exception("Request failed")):
-            with pytest.raises(Exception, match="Request failed"):
-                await client.get_ip_routes()
+    async def test_get_ip_pools_cache_invalidate(self, client, request_mock):
+        """Test that invalidating the cache forces a new request."""
+        request_mock.return_value = _SAMPLE_IP_POOLS
+        await client.get_ip_pools()
+        client.invalidate('/ip/pool')
+        await client.get_ip_pools()
+        
+        assert request_mock.call_count == 2
     
-    @pytest.mark.asyncio
-    async def test_get_ip_pools_success(self, client, sample_ip_pools):
-        """Test IP pools retrieval."""
-        with patch.object(client, '_make_request', return_value=sample_ip_pools):
-            result = await client.get_ip_pools()
-            assert result == sample_ip_pools
+    async def test_get_ip_addresses_cache_keyed_by_filter(self, client, request_mock):
+        """Test that different filters are cached separately."""
+        request_mock.return_value = _SAMPLE_IP_ADDRESSES
+        await client.get_ip_addresses({"interface": "ether1"})
+        await client.get_ip_addresses({"interface": "ether2"})
+        await client.get_ip_addresses({"interface": "ether1"})
+        
+        assert request_mock.call_count == 2
     
-    @pytest.mark.asyncio
-    async def test_get_ip_pools_dict_response(self, client, sample_ip_pools):
-        """Test IP pools retrieval with dict response containing 'ret' key."""
-        with patch.object(client, '_make_request', return_value={"ret": sample_ip_pools}):
-            result = await client.get_ip_pools()
-            assert result == sample_ip_pools
+    async def test_expired_cache_entries_evicted(self, client, request_mock, monkeypatch):
+        """Test that expired entries and their locks are dropped when a new response is cached."""
+        monkeypatch.setattr('src.mcp_mikrotik.ip.client.IP_ADDRESSES_CACHE_TTL', 0.0)
+        request_mock.return_value = _SAMPLE_IP_ADDRESSES
+        await client.get_ip_addresses({"interface": "ether1"})
+        await client.get_ip_addresses({"interface": "ether2"})
+        
+        assert [key[2] for key in client._cache] == [(("interface", "ether2"),)]
+        assert list(client._cache_locks) == list(client._cache)
     
-    @pytest.mark.asyncio
-    async def test_get_ip_pools_unexpected_response(self, client):
-        """Test IP pools retrieval with unexpected response type."""
-        with patch.object(client, '_make_request', return_value="unexpected"):
-            result = await client.get_ip_pools()
-            assert result == []
+    async def test_invalidate_drops_cache_locks(self, client, request_mock):
+        """Test that invalidating the cache also drops the per-request locks."""
+        request_mock.return_value = _SAMPLE_IP_POOLS
+        await client.get_ip_pools()
+        client.invalidate()
+        
+        assert client._cache == {}
+        assert client._cache_locks == {}
     
-    @pytest.mark.asyncio
-    async def test_get_ip_pools_request_error(self, client):
-        """Test IP pools retrieval with request error."""
-        with patch.object(client, '_make_request', side_effect=Exception("Request failed")):
-            with pytest.raises(Exception, match="Request failed"):
-                await client.get_ip_pools()
+    async def test_main_client_invalidate_reaches_ip_cache(self, mikrotik_config, monkeypatch, async_mock):
+        """Test that invalidating the main client drops the IP client's cached responses."""
+        main_client = MikroTikClient(mikrotik_config)
+        monkeypatch.setattr(main_client.ip, '_make_request', async_mock)
+        async_mock.return_value = _SAMPLE_IP_POOLS
+        await main_client.get_ip_pools()
+        main_client.invalidate('/ip/pool')
+        await main_client.get_ip_pools()
+        
+        assert async_mock.call_count == 2
     
-    @pytest.mark.asyncio
-    async def test_get_network_summary_success(self, client, sample_ip_addresses, sample_ip_routes, sample_ip_pools):
+    async def test_get_ip_pools_errors_not_cached(self, client, request_mock):
+        """Test that failed requests are not cached."""
+        request_mock.side_effect = [Exception("Request failed"), _SAMPLE_IP_POOLS]
+        with pytest.raises(Exception):
+            await client.get_ip_pools()
+        result = await client.get_ip_pools()
+        
+        assert result == _SAMPLE_IP_POOLS
+    
+    async def test_get_network_summary_success(self, client, monkeypatch):
         """Test network summary retrieval."""
-        with patch.object(client, 'get_ip_addresses', return_value=sample_ip_addresses), \
-             patch.object(client, 'get_ip_routes', return_value=sample_ip_routes), \
-             patch.object(client, 'get_ip_pools', return_value=sample_ip_pools):
-            
-            result = await client.get_network_summary()
-            
-            assert result["ip_addresses_count"] == 2
-            assert result["ip_routes_count"] == 2
-            assert result["ip_pools_count"] == 2
-            assert "ether1" in result["interfaces"]
-            assert "ether2" in result["interfaces"]
-            assert "192.168.1.0" in result["networks"]
-            assert "10.0.0.0" in result["networks"]
-            assert "10.0.0.1" in result["gateways"]
-            assert "0.0.0.0" in result["gateways"]
+        monkeypatch.setattr(client, 'get_ip_addresses', async_return(_SAMPLE_IP_ADDRESSES))
+        monkeypatch.setattr(client, 'get_ip_routes', async_return(_SAMPLE_IP_ROUTES))
+        monkeypatch.setattr(client, 'get_ip_pools', async_return(_SAMPLE_IP_POOLS))
+        
+        result = await client.get_network_summary()
+        
+        assert result["ip_addresses_count"] == 2
+        assert result["ip_routes_count"] == 2
+        assert result["ip_pools_count"] == 2
+        assert "ether1" in result["interfaces"]
+        assert "ether2" in result["interfaces"]
+        assert "192.168.1.0" in result["networks"]
+        assert "10.0.0.0" in result["networks"]
+        assert "10.0.0.1" in result["gateways"]
+        assert "0.0.0.0" in result["gateways"]
     
-    @pytest.mark.asyncio
-    async def test_get_network_summary_with_exceptions(self, client):
+    async def test_get_network_summary_with_exceptions(self, client, monkeypatch):
         """Test network summary retrieval with some API calls failing."""
-        with patch.object(client, 'get_ip_addresses', side_effect=Exception("Addresses failed")), \
-             patch.object(client, 'get_ip_routes', return_value=[]), \
-             patch.object(client, 'get_ip_pools', return_value=[]):
-            
-            result = await client.get_network_summary()
-            
-            assert result["ip_addresses_count"] == 0
-            assert result["ip_routes_count"] == 0
-            assert result["ip_pools_count"] == 0
-            assert result["interfaces"] == []
-            assert result["networks"] == []
-            assert result["gateways"] == []
+        monkeypatch.setattr(client, 'get_ip_addresses', async_raise(Exception("Addresses failed")))
+        monkeypatch.setattr(client, 'get_ip_routes', async_return([]))
+        monkeypatch.setattr(client, 'get_ip_pools', async_return([]))
+        
+        result = await client.get_network_summary()
+        
+        assert result["ip_addresses_count"] == 0
+        assert result["ip_routes_count"] == 0
+        assert result["ip_pools_count"] == 0
+        assert result["interfaces"] == []
+        assert result["networks"] == []
+        assert result["gateways"] == []
     
-    @pytest.mark.asyncio
-    async def test_get_network_summary_all_exceptions(self, client):
+    async def test_get_network_summary_all_exceptions(self, client, monkeypatch):
         """Test network summary retrieval with all API calls failing."""
-        with patch.object(client, 'get_ip_addresses', side_effect=Exception("Addresses failed")), \
-             patch.object(client, 'get_ip_routes', side_effect=Exception("Routes failed")), \
-             patch.object(client, 'get_ip_pools', side_effect=Exception("Pools failed")):
-            
-            result = await client.get_network_summary()
-            
-            # The current implementation handles exceptions gracefully and returns empty results
-            assert result["ip_addresses_count"] == 0
-            assert result["ip_routes_count"] == 0
-            assert result["ip_pools_count"] == 0
-            assert result["interfaces"] == []
-            assert result["networks"] == []
-            assert result["gateways"] == []
+        monkeypatch.setattr(client, 'get_ip_addresses', async_raise(Exception("Addresses failed")))
+        monkeypatch.setattr(client, 'get_ip_routes', async_raise(Exception("Routes failed")))
+        monkeypatch.setattr(client, 'get_ip_pools', async_raise(Exception("Pools failed")))
+        
+        result = await client.get_network_summary()
+        
+        # The current implementation handles exceptions gracefully and returns empty results
+        assert result["ip_addresses_count"] == 0
+        assert result["ip_routes_count"] == 0
+        assert result["ip_pools_count"] == 0
+        assert result["interfaces"] == []
+        assert result["networks"] == []
+        assert result["gateways"] == []
     
     def test_build_ip_addresses_request_body(self, client):
         """Test request body building for IP addresses API calls."""
@@ -263,17 +260,6 @@ class TestMikroTikIPClient:
         assert request_body["comment"] == "LAN interface"
         assert request_body["disabled"] is False
     
-    def test_build_ip_addresses_request_body_partial(self, client):
-        """Test request body building for IP addresses with partial options."""
-        options = {
-            "interface": "ether1"
-            # Missing other options
-        }
-        request_body = client._build_ip_addresses_request_body(options)
-        
-        assert request_body["interface"] == "ether1"
-        assert len(request_body) == 1
-    
     def test_build_ip_routes_request_body(self, client):
         """Test request body building for IP routes API calls."""
         options = {
@@ -289,43 +275,25 @@ class TestMikroTikIPClient:
         assert request_body["routing-mark"] == "main"
         assert request_body["disabled"] is False
     
-    def test_build_ip_routes_request_body_partial(self, client):
-        """Test request body building for IP routes with partial options."""
-        options = {
-            "dst_address": "0.0.0.0/0"
-            # Missing other options
-        }
-        request_body = client._build_ip_routes_request_body(options)
-        
-        assert request_body["dst-address"] == "0.0.0.0/0"
-        assert len(request_body) == 1
-    
-    def test_build_ip_addresses_request_body_none_values(self, client):
-        """Test request body building for IP addresses with None values."""
-        options = {
-            "interface": "ether1",
-            "network": None,
-            "comment": None,
-            "disabled": None
-        }
-        request_body = client._build_ip_addresses_request_body(options)
+    @pytest.mark.parametrize("builder_name, options, expected", [
+        ("_build_ip_addresses_request_body", {"interface": "ether1"}, {"interface": "ether1"}),
+        ("_build_ip_addresses_request_body",
+         {"interface": "ether1", "network": None, "comment": None, "disabled": None},
+         {"interface": "ether1"}),
+        ("_build_ip_routes_request_body", {"dst_address": "0.0.0.0/0"}, {"dst-address": "0.0.0.0/0"}),
+        ("_build_ip_routes_request_body",
+         {"dst_address": "0.0.0.0/0", "gateway": None, "routing_mark": None, "disabled": None},
+         {"dst-address": "0.0.0.0/0"}),
+        ("_build_ip_addresses_request_body",
+         {"interface": "", "network": "", "comment": "", "disabled": False},
+         {"disabled": False}),
+        ("_build_ip_routes_request_body",
+         {"dst_address": "", "gateway": "", "routing_mark": "", "disabled": False},
+         {"disabled": False}),
+    ], ids=["addresses-partial", "addresses-none-values", "routes-partial", "routes-none-values",
+            "addresses-empty-strings", "routes-empty-strings"])
+    def test_build_request_body_skips_missing_options(self, client, builder_name, options, expected):
+        """Test that missing, None or empty string filters are left out of the request body."""
+        request_body = getattr(client, builder_name)(options)
         
-        assert request_body["interface"] == "ether1"
-        assert "network" not in request_body
-        assert "comment" not in request_body
-        assert "disabled" not in request_body
-    
-    def test_build_ip_routes_request_body_none_values(self, client):
-        """Test request body building for IP routes with None values."""
-        options = {
-            "dst_address": "0.0.0.0/0",
-            "gateway": None,
-            "routing_mark": None,
-            "disabled": None
-        }
-        request_body = client._build_ip_routes_request_body(options)
-        
-        assert request_body["dst-address"] == "0.0.0.0/0"
-        assert "gateway" not in request_body
-        assert "routing-mark" not in request_body
-        assert "disabled" not in request_body
+        assert request_body == expected
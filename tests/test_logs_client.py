@@ -4,151 +4,238 @@ Tests for MikroTik Logs Client
 This module tests the logs client functionality including log retrieval,
 filtering, and specialized log type methods.
 """
+import json
+
+import aiohttp
 import pytest
-from unittest.mock import Mock, patch, AsyncMock
-import sys
-import os
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from unittest.mock import patch
+from tests.stubs import async_raise, async_return
+
+from src.mcp_mikrotik.logs.client import MikroTikLogsClient, _compile_where
+from src.mcp_mikrotik.logs.models import (
+    GetLogsArgs,
+    is_valid_get_logs_args,
+    is_valid_get_logs_by_condition_args
+)
 
-# Add the project root to the Python path
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root)
 
-from src.mcp_mikrotik.logs.client import MikroTikLogsClient
-from src.mcp_mikrotik.logs.models import GetLogsArgs
+# Sample log entries; tests only read them, so one copy is shared
+_SAMPLE_LOGS = [
+    {
+        "time": "2024-01-01 12:00:00",
+        "topics": "system,info",
+        "message": "System started",
+        "level": "info"
+    },
+    {
+        "time": "2024-01-01 12:01:00",
+        "topics": "dhcp,info",
+        "message": "DHCP server started",
+        "level": "info"
+    },
+    {
+        "time": "2024-01-01 12:02:00",
+        "topics": "system,warning",
+        "message": "High memory usage",
+        "level": "warning"
+    }
+]
 
 
 class TestMikroTikLogsClient:
     """Test cases for MikroTikLogsClient."""
     
-    @pytest.fixture
-    def client(self):
-        """Create a logs client instance for testing."""
-        config = {
-            "host": "192.168.1.1",
-            "username": "admin",
-            "password": "test_password",
-            "port": 443,
-            "useSSL": True
-        }
-        return MikroTikLogsClient(config)
+    @pytest.fixture(scope="module")
+    def client(self, mikrotik_config):
+        """Create a logs client instance shared by the module's tests."""
+        return MikroTikLogsClient(mikrotik_config)
     
     @pytest.fixture
-    def sample_logs(self):
-        """Sample log entries for testing."""
-        return [
-            {
-                "time": "2024-01-01 12:00:00",
-                "topics": "system,info",
-                "message": "System started",
-                "level": "info"
-            },
-            {
-                "time": "2024-01-01 12:01:00",
-                "topics": "dhcp,info",
-                "message": "DHCP server started",
-                "level": "info"
-            },
-            {
-                "time": "2024-01-01 12:02:00",
-                "topics": "system,warning",
-                "message": "High memory usage",
-                "level": "warning"
-            }
-        ]
+    def request_mock(self, client, monkeypatch, async_mock):
+        """Stub the client's _make_request with the shared AsyncMock for one test."""
+        monkeypatch.setattr(client, '_make_request', async_mock)
+        return async_mock
     
-    @pytest.mark.asyncio
-    async def test_get_logs_basic(self, client, sample_logs):
+    async def test_get_logs_basic(self, client, monkeypatch):
         """Test basic log retrieval without options."""
-        with patch.object(client, '_make_request', return_value=sample_logs):
-            result = await client.get_logs()
-            assert result == sample_logs
+        monkeypatch.setattr(client, '_make_request', async_return(_SAMPLE_LOGS))
+        result = await client.get_logs()
+        assert result == _SAMPLE_LOGS
     
-    @pytest.mark.asyncio
-    async def test_get_logs_with_count_only(self, client):
+    async def test_get_logs_with_count_only(self, client, monkeypatch):
         """Test log retrieval with countOnly option."""
-        with patch.object(client, '_make_request', return_value="150"):
-            result = await client.get_logs({"countOnly": True})
-            assert result == 150
+        monkeypatch.setattr(client, '_make_request', async_return("150"))
+        result = await client.get_logs({"countOnly": True})
+        assert result == 150
     
-    @pytest.mark.asyncio
-    async def test_get_logs_with_filtering(self, client, sample_logs):
+    async def test_get_logs_with_filtering(self, client, monkeypatch):
         """Test log retrieval with client-side filtering."""
-        with patch.object(client, '_make_request', return_value=sample_logs):
-            result = await client.get_logs({"where": 'topics~"system"'})
-            # Should return logs with "system" in topics
-            assert len(result) == 2
-            assert all("system" in log["topics"] for log in result)
-    
-    @pytest.mark.asyncio
-    async def test_get_logs_with_max_logs_limit(self, client, sample_logs):
+        monkeypatch.setattr(client, '_make_request', async_return(_SAMPLE_LOGS))
+        result = await client.get_logs({"where": 'topics~"system"'})
+        # Should return logs with "system" in topics
+        assert len(result) == 2
+        assert all("system" in log["topics"] for log in result)
+    
+    async def test_get_logs_with_max_logs_limit(self, client, monkeypatch):
         """Test log retrieval with max_logs limit."""
-        with patch.object(client, '_make_request', return_value=sample_logs):
-            result = await client.get_logs(max_logs=2)
-            assert len(result) == 2
-    
-    @pytest.mark.asyncio
-    async def test_get_debug_logs(self, client, sample_logs):
-        """Test debug logs retrieval."""
-        with patch.object(client, '_make_request', return_value=sample_logs):
-            result = await client.get_debug_logs()
-            # Should return only logs with "debug" in topics
-            # Since our sample doesn't have debug logs, this should return empty
-            assert result == []
-    
-    @pytest.mark.asyncio
-    async def test_get_error_logs(self, client, sample_logs):
-        """Test error logs retrieval."""
-        with patch.object(client, '_make_request', return_value=sample_logs):
-            result = await client.get_error_logs()
-            # Should return only logs with "error" in topics
-            # Since our sample doesn't have error logs, this should return empty
-            assert result == []
-    
-    @pytest.mark.asyncio
-    async def test_get_warning_logs(self, client, sample_logs):
-        """Test warning logs retrieval."""
-        with patch.object(client, '_make_request', return_value=sample_logs):
+        monkeypatch.setattr(client, '_make_request', async_return(_SAMPLE_LOGS))
+        result = await client.get_logs(max_logs=2)
+        assert len(result) == 2
+    
+    @pytest.mark.parametrize("method_name, topic, expected_count", [
+        ("get_debug_logs", "debug", 0),
+        ("get_error_logs", "error", 0),
+        ("get_warning_logs", "warning", 1),
+        ("get_info_logs", "info", 2),
+    ])
+    async def test_get_topic_logs(self, client, monkeypatch, method_name, topic, expected_count):
+        """Test that each topic getter returns only the logs with its topic."""
+        monkeypatch.setattr(client, '_make_request', async_return(_SAMPLE_LOGS))
+        result = await getattr(client, method_name)()
+        
+        assert len(result) == expected_count
+        assert all(topic in log["topics"] for log in result)
+    
+    async def test_get_all_logs_partitioned(self, client, request_mock):
+        """Test that one request yields the same logs as the per-topic getters."""
+        request_mock.return_value = _SAMPLE_LOGS
+        result = await client.get_all_logs_partitioned()
+        
+        request_mock.assert_called_once()
+        assert set(result) == {"debug", "error", "warning", "info"}
+        assert result["info"] == await client.get_info_logs()
+        assert result["error"] == await client.get_error_logs()
+    
+    async def test_get_all_logs_partitioned_limit(self, client, monkeypatch):
+        """Test that each topic is capped at max_logs entries."""
+        monkeypatch.setattr(client, '_make_request', async_return(_SAMPLE_LOGS))
+        result = await client.get_all_logs_partitioned(max_logs=1)
+        
+        assert len(result["info"]) == 1
+    
+    async def test_get_all_logs_partitioned_no_limit(self, client, monkeypatch):
+        """Test that max_logs=None returns every matching entry."""
+        logs = [{"topics": "system,info", "message": f"entry {i}"} for i in range(3)]
+        monkeypatch.setattr(client, '_make_request', async_return(logs))
+        with patch.object(client, '_log_warning') as mock_warning:
+            result = await client.get_all_logs_partitioned(max_logs=None)
+            
+            assert result["info"] == logs
+            mock_warning.assert_not_called()
+    
+    async def test_get_all_logs_partitioned_stops_reading(self, client, monkeypatch):
+        """Test that a streamed response is read only until every topic is over max_logs."""
+        logs = [{"topics": "debug,error,warning,info", "message": f"entry {i}"} for i in range(5)]
+        consumed = []
+        
+        async def stream():
+            for log in logs:
+                consumed.append(log)
+                yield log
+        
+        monkeypatch.setattr(client, '_make_request', async_return(stream()))
+        with patch.object(client, '_log_warning') as mock_warning:
+            result = await client.get_all_logs_partitioned(max_logs=1)
+            
+            assert all(entries == logs[:1] for entries in result.values())
+            assert consumed == logs[:2]
+            assert mock_warning.call_count == 4
+    
+    async def test_get_all_logs_partitioned_error_logged_once(self, client, monkeypatch):
+        """Test that a request error is logged once before being re-raised."""
+        monkeypatch.setattr(client, '_make_request', async_raise(aiohttp.ClientError("Connection refused")))
+        with patch.object(client, '_log_error') as mock_error:
+            with pytest.raises(aiohttp.ClientError):
+                await client.get_all_logs_partitioned()
+            
+            mock_error.assert_called_once_with("Error retrieving logs by topic: Connection refused")
+    
+    async def test_category_logs_use_precompiled_predicate(self, client, monkeypatch):
+        """Test that category helpers don't re-parse their constant where filter."""
+        monkeypatch.setattr(client, '_make_request', async_return(_SAMPLE_LOGS))
+        with patch.object(client, '_where_predicate') as mock_predicate:
             result = await client.get_warning_logs()
-            # Should return only logs with "warning" in topics
-            # Should return 1 log with warning in topics
-            assert len(result) == 1
-            assert "warning" in result[0]["topics"]
-    
-    @pytest.mark.asyncio
-    async def test_get_info_logs(self, client, sample_logs):
-        """Test info logs retrieval."""
-        with patch.object(client, '_make_request', return_value=sample_logs):
-            result = await client.get_info_logs()
-            # Should return only logs with "info" in topics
-            # Should return 2 logs with info in topics
-            assert len(result) == 2
-            assert all("info" in log["topics"] for log in result)
-    
-    @pytest.mark.asyncio
-    async def test_get_logs_from_buffer(self, client, sample_logs):
+            
+            assert result == [_SAMPLE_LOGS[2]]
+            mock_predicate.assert_not_called()
+    
+    async def test_get_logs_from_buffer(self, client, monkeypatch):
         """Test logs retrieval from specific buffer."""
-        with patch.object(client, '_make_request', return_value=sample_logs):
-            result = await client.get_logs_from_buffer("main")
-            # Should call get_logs with buffer filter
-            assert result == sample_logs
+        monkeypatch.setattr(client, '_make_request', async_return(_SAMPLE_LOGS))
+        result = await client.get_logs_from_buffer("main")
+        # Should call get_logs with buffer filter
+        assert result == _SAMPLE_LOGS
     
-    @pytest.mark.asyncio
-    async def test_get_logs_with_extra_info(self, client, sample_logs):
+    async def test_get_logs_with_extra_info(self, client, monkeypatch):
         """Test logs retrieval with extra info."""
-        with patch.object(client, '_make_request', return_value=sample_logs):
-            result = await client.get_logs_with_extra_info()
-            # Should call get_logs with withExtraInfo option
-            assert result == sample_logs
+        monkeypatch.setattr(client, '_make_request', async_return(_SAMPLE_LOGS))
+        result = await client.get_logs_with_extra_info()
+        # Should call get_logs with withExtraInfo option
+        assert result == _SAMPLE_LOGS
     
-    @pytest.mark.asyncio
-    async def test_find_logs(self, client, sample_logs):
+    async def test_find_logs(self, client, monkeypatch):
         """Test find_logs method."""
-        with patch.object(client, '_make_request', return_value=sample_logs):
-            result = await client.find_logs('topics~"system"')
-            # Should return only logs with "system" in topics
-            # Should return 2 logs with system in topics
-            assert len(result) == 2
-            assert all("system" in log["topics"] for log in result)
+        monkeypatch.setattr(client, '_make_request', async_return(_SAMPLE_LOGS))
+        result = await client.find_logs('topics~"system"')
+        # Should return only logs with "system" in topics
+        # Should return 2 logs with system in topics
+        assert len(result) == 2
+        assert all("system" in log["topics"] for log in result)
+    
+    async def test_get_logs_streamed_response(self, client, monkeypatch):
+        """Test that streamed responses are filtered and truncated as they arrive."""
+        consumed = []
+        
+        async def stream():
+            for log in _SAMPLE_LOGS:
+                consumed.append(log)
+                yield log
+        
+        monkeypatch.setattr(client, '_make_request', async_return(stream()))
+        with patch.object(client, '_log_warning') as mock_warning:
+            result = await client.get_logs({'where': 'topics~"info"'}, max_logs=1)
+            
+            assert result == [_SAMPLE_LOGS[0]]
+            # Stopped after the second match instead of reading the whole response
+            assert consumed == _SAMPLE_LOGS[:2]
+            mock_warning.assert_called_once()
+    
+    async def test_get_logs_streamed_response_under_limit(self, client, monkeypatch):
+        """Test that a streamed response within max_logs is returned whole, without warning."""
+        async def stream():
+            for log in _SAMPLE_LOGS:
+                yield log
+        
+        monkeypatch.setattr(client, '_make_request', async_return(stream()))
+        with patch.object(client, '_log_warning') as mock_warning:
+            result = await client.get_logs()
+            
+            assert result == _SAMPLE_LOGS
+            mock_warning.assert_not_called()
+    
+    @pytest.mark.parametrize("body", [_SAMPLE_LOGS, {"ret": _SAMPLE_LOGS}], ids=["list", "ret"])
+    async def test_get_logs_over_http(self, mikrotik_config, body):
+        """Test list and 'ret' wrapped bodies sent in chunks by a real HTTP server (streamed with ijson if installed)."""
+        async def log_print(request):
+            response = web.StreamResponse()
+            await response.prepare(request)
+            payload = b"  " + json.dumps(body).encode()
+            for start in range(0, len(payload), 16):
+                await response.write(payload[start:start + 16])
+            return response
+        
+        app = web.Application()
+        app.router.add_post('/rest/log/print', log_print)
+        async with TestServer(app, host='127.0.0.1') as server:
+            config = {**mikrotik_config, "host": "127.0.0.1", "port": server.port, "useSSL": False}
+            async with MikroTikLogsClient(config) as http_client:
+                with patch.object(http_client, '_log_warning') as mock_warning:
+                    result = await http_client.get_logs({'where': 'topics~"system"'})
+        
+        assert result == [_SAMPLE_LOGS[0], _SAMPLE_LOGS[2]]
+        mock_warning.assert_not_called()
     
     def test_build_logs_request_body(self, client):
         """Test request body building for logs API calls."""
@@ -164,6 +251,38 @@ class TestMikroTikLogsClient:
         # where parameter should not be in request body (handled client-side)
         assert "where" not in request_body
     
+    def test_build_logs_request_body_brief_proplist(self, client):
+        """Test that brief requests only fetch the brief properties."""
+        request_body = client._build_logs_request_body({"brief": True})
+        
+        assert request_body[".proplist"] == [".id", "time", "topics", "message"]
+    
+    def test_build_logs_request_body_proplist_includes_filter_fields(self, client):
+        """Test that fields used by the where filter are always fetched."""
+        options = {
+            "proplist": ["time"],
+            "where": 'topics~"system" and message~"login"'
+        }
+        request_body = client._build_logs_request_body(options)
+        
+        assert request_body[".proplist"] == ["time", "topics", "message"]
+    
+    def test_build_logs_request_body_string_proplist(self, client):
+        """Test that a comma-separated proplist is split into properties before merging."""
+        options = {
+            "proplist": "time,message",
+            "where": 'topics~"system"'
+        }
+        request_body = client._build_logs_request_body(options)
+        
+        assert request_body[".proplist"] == ["time", "message", "topics"]
+    
+    def test_build_logs_request_body_no_proplist(self, client):
+        """Test that full entries are requested when neither proplist nor brief is set."""
+        request_body = client._build_logs_request_body({"where": 'topics~"system"'})
+        
+        assert ".proplist" not in request_body
+    
     def test_handle_count_only_response_string(self, client):
         """Test handling of count-only response as string."""
         result = client._handle_count_only_response("150")
@@ -179,16 +298,16 @@ class TestMikroTikLogsClient:
         result = client._handle_count_only_response("invalid")
         assert result == 0
     
-    def test_extract_log_entries_list(self, client, sample_logs):
+    def test_extract_log_entries_list(self, client):
         """Test extraction of log entries from list response."""
-        result = client._extract_log_entries(sample_logs)
-        assert result == sample_logs
+        result = client._extract_log_entries(_SAMPLE_LOGS)
+        assert result == _SAMPLE_LOGS
     
-    def test_extract_log_entries_dict_with_ret(self, client, sample_logs):
+    def test_extract_log_entries_dict_with_ret(self, client):
         """Test extraction of log entries from dict with 'ret' key."""
-        response = {"ret": sample_logs}
+        response = {"ret": _SAMPLE_LOGS}
         result = client._extract_log_entries(response)
-        assert result == sample_logs
+        assert result == _SAMPLE_LOGS
     
     def test_extract_log_entries_dict_without_ret(self, client):
         """Test extraction of log entries from dict without 'ret' key."""
@@ -202,98 +321,154 @@ class TestMikroTikLogsClient:
         result = client._extract_log_entries(response)
         assert result == []
     
-    def test_filter_logs_no_filter(self, client, sample_logs):
+    def test_iter_log_entries_is_lazy(self, client):
+        """Test that log entries are yielded without copying the response."""
+        entries = client._iter_log_entries({"ret": _SAMPLE_LOGS})
+        assert next(entries) is _SAMPLE_LOGS[0]
+    
+    def test_filter_logs_no_filter(self, client):
         """Test log filtering with no filter condition."""
-        result = client._filter_logs(sample_logs, "")
-        assert result == sample_logs
+        result = client._filter_logs(_SAMPLE_LOGS, "")
+        assert result == _SAMPLE_LOGS
     
-    def test_filter_logs_topics_contains(self, client, sample_logs):
+    def test_filter_logs_topics_contains(self, client):
         """Test log filtering with topics contains condition."""
-        result = client._filter_logs(sample_logs, 'topics~"system"')
+        result = client._filter_logs(_SAMPLE_LOGS, 'topics~"system"')
         assert len(result) == 2
         assert all("system" in log["topics"] for log in result)
     
-    def test_filter_logs_message_contains(self, client, sample_logs):
+    def test_filter_logs_message_contains(self, client):
         """Test log filtering with message contains condition."""
-        result = client._filter_logs(sample_logs, 'message~"DHCP"')
+        result = client._filter_logs(_SAMPLE_LOGS, 'message~"DHCP"')
         assert len(result) == 1
         assert "DHCP" in result[0]["message"]
     
-    def test_filter_logs_multiple_conditions_and(self, client, sample_logs):
+    def test_filter_logs_multiple_conditions_and(self, client):
         """Test log filtering with multiple AND conditions."""
-        result = client._filter_logs(sample_logs, 'topics~"system" and message~"started"')
+        result = client._filter_logs(_SAMPLE_LOGS, 'topics~"system" and message~"started"')
         assert len(result) == 1
         assert "system" in result[0]["topics"]
         assert "started" in result[0]["message"]
     
-    def test_filter_logs_multiple_conditions_or(self, client, sample_logs):
+    def test_filter_logs_multiple_conditions_or(self, client):
         """Test log filtering with multiple OR conditions."""
-        result = client._filter_logs(sample_logs, 'topics~"system" or topics~"dhcp"')
+        result = client._filter_logs(_SAMPLE_LOGS, 'topics~"system" or topics~"dhcp"')
         assert len(result) == 3  # All logs should match
     
-    def test_filter_logs_case_insensitive(self, client, sample_logs):
+    def test_filter_logs_case_insensitive(self, client):
         """Test log filtering with case-insensitive condition."""
-        result = client._filter_logs(sample_logs, 'topics~i"SYSTEM"')
+        result = client._filter_logs(_SAMPLE_LOGS, 'topics~i"SYSTEM"')
         assert len(result) == 2
         assert all("system" in log["topics"].lower() for log in result)
     
-    def test_filter_logs_equality_operator(self, client, sample_logs):
+    def test_filter_logs_case_insensitive_multiple_conditions(self, client):
+        """Test several case-insensitive conditions on the same field."""
+        result = client._filter_logs(_SAMPLE_LOGS, 'message~i"SYSTEM" or message~i"memory"')
+        assert [log["message"] for log in result] == ["System started", "High memory usage"]
+        
+        result = client._filter_logs(_SAMPLE_LOGS, 'message~i"dhcp" and message~i"STARTED"')
+        assert [log["message"] for log in result] == ["DHCP server started"]
+    
+    def test_filter_logs_equality_operator(self, client):
         """Test log filtering with equality operator."""
-        result = client._filter_logs(sample_logs, 'topics="system,info"')
+        result = client._filter_logs(_SAMPLE_LOGS, 'topics="system,info"')
         assert len(result) == 1
         assert result[0]["topics"] == "system,info"
     
-    def test_filter_logs_invalid_syntax(self, client, sample_logs):
+    def test_filter_logs_invalid_syntax(self, client):
         """Test log filtering with invalid syntax (should return all logs)."""
-        result = client._filter_logs(sample_logs, 'invalid~syntax')
-        assert result == sample_logs
-    
-    def test_check_condition_topics_contains(self, client):
-        """Test condition checking for topics contains."""
-        log = {"topics": "system,info", "message": "test"}
-        result = client._check_condition(log, 'topics~"system"')
-        assert result is True
-    
-    def test_check_condition_message_contains(self, client):
-        """Test condition checking for message contains."""
-        log = {"topics": "system,info", "message": "test message"}
-        result = client._check_condition(log, 'message~"test"')
-        assert result is True
-    
-    def test_check_condition_topics_equals(self, client):
-        """Test condition checking for topics equality."""
-        log = {"topics": "system,info", "message": "test"}
-        result = client._check_condition(log, 'topics="system,info"')
-        assert result is True
-    
-    def test_check_condition_message_equals(self, client):
-        """Test condition checking for message equality."""
-        log = {"topics": "system,info", "message": "test message"}
-        result = client._check_condition(log, 'message="test message"')
-        assert result is True
-    
-    def test_check_condition_case_insensitive(self, client):
-        """Test condition checking for case-insensitive contains."""
-        log = {"topics": "SYSTEM,INFO", "message": "TEST"}
-        result = client._check_condition(log, 'topics~i"system"')
-        assert result is True
-    
-    def test_check_condition_or_operator(self, client):
-        """Test condition checking with OR operator."""
-        log = {"topics": "system,info", "message": "test"}
-        # OR conditions are now handled at the _filter_logs level, not in _check_condition
-        # This should return False since the condition contains "or" which is not a valid single condition
-        result = client._check_condition(log, 'topics~"dhcp" or topics~"system"')
-        assert result is False
-    
-    def test_check_condition_unknown_condition(self, client):
-        """Test condition checking with unknown condition (should return True)."""
-        log = {"topics": "system,info", "message": "test"}
-        result = client._check_condition(log, 'unknown~"value"')
-        assert result is True
-    
-    def test_check_condition_missing_field(self, client):
-        """Test condition checking with missing field."""
-        log = {"message": "test"}  # Missing topics field
-        result = client._check_condition(log, 'topics~"system"')
-        assert result is False
+        result = client._filter_logs(_SAMPLE_LOGS, 'invalid~syntax')
+        assert result == _SAMPLE_LOGS
+    
+    def test_filter_logs_limit(self, client):
+        """Test that filtering stops once the limit of matches is reached."""
+        result = client._filter_logs(_SAMPLE_LOGS, 'topics~"info"', limit=1)
+        assert result == [_SAMPLE_LOGS[0]]
+    
+    def test_filter_logs_mixed_and_or(self, client):
+        """Test that AND binds tighter than OR in mixed expressions."""
+        result = client._filter_logs(_SAMPLE_LOGS, 'topics~"dhcp" or topics~"system" and message~"started"')
+        assert len(result) == 2
+        assert all("dhcp" in log["topics"] or "started" in log["message"] for log in result)
+    
+    def test_filter_logs_parentheses(self, client):
+        """Test grouping conditions with parentheses."""
+        result = client._filter_logs(_SAMPLE_LOGS, '(topics~"dhcp" or topics~"system") and message~"memory"')
+        assert len(result) == 1
+        assert result[0]["message"] == "High memory usage"
+    
+    def test_filter_logs_quoted_value_with_keywords(self, client):
+        """Test that 'and'/'or' inside quoted values are not treated as operators."""
+        logs = [
+            {"topics": "system,info", "message": "user login and logout"},
+            {"topics": "system,info", "message": "user login"},
+        ]
+        result = client._filter_logs(logs, 'message~"login and logout"')
+        assert result == [logs[0]]
+    
+    def test_filter_logs_unbalanced_parentheses(self, client):
+        """Test that malformed expressions return all logs."""
+        result = client._filter_logs(_SAMPLE_LOGS, '(topics~"system"')
+        assert result == _SAMPLE_LOGS
+    
+    def test_filter_logs_compiled_once(self, client):
+        """Test that a where string is compiled once and reused."""
+        where = 'topics~"system" and message~"compiled once"'
+        client._filter_logs(_SAMPLE_LOGS, where)
+        hits = _compile_where.cache_info().hits
+        client._filter_logs(_SAMPLE_LOGS, where)
+        assert _compile_where.cache_info().hits == hits + 1
+    
+    @pytest.mark.benchmark
+    def test_filter_logs_benchmark(self, client):
+        """Benchmark filtering a large batch of logs (measured under pytest --codspeed)."""
+        logs = _SAMPLE_LOGS * 1000
+        result = client._filter_logs(logs, 'topics~"system" and message~"started"')
+        assert len(result) == 1000
+    
+    @pytest.mark.parametrize("log, where, expected", [
+        ({"topics": "system,info", "message": "test"}, 'topics~"system"', True),
+        ({"topics": "system,info", "message": "test message"}, 'message~"test"', True),
+        ({"topics": "system,info", "message": "test"}, 'topics="system,info"', True),
+        ({"topics": "system,info", "message": "test message"}, 'message="test message"', True),
+        ({"topics": "SYSTEM,INFO", "message": "TEST"}, 'topics~i"system"', True),
+        ({"topics": "system,info", "message": "test"}, 'topics~"dhcp" or topics~"system"', True),
+        ({"topics": "system,info", "message": "test"}, 'unknown~"value"', True),
+        ({"message": "test"}, 'topics~"system"', False),
+    ], ids=["topics-contains", "message-contains", "topics-equals", "message-equals",
+            "case-insensitive", "or-operator", "unknown-condition", "missing-field"])
+    def test_compiled_condition(self, log, where, expected):
+        """Test that single conditions compile to predicates matching the expected entries."""
+        predicate, _ = _compile_where(where)
+        assert predicate(log) is expected
+    
+    def test_compiled_condition_reports_unsupported(self):
+        """Test that unknown conditions are reported instead of silently accepted."""
+        _, unsupported = _compile_where('unknown~"value" and topics~"system"')
+        assert unsupported == ('unknown~"value"',)
+
+
+class TestLogsArgsValidation:
+    """Test cases for the log argument validators."""
+    
+    def test_valid_get_logs_args(self):
+        """Test that correctly typed arguments are accepted."""
+        assert is_valid_get_logs_args({})
+        assert is_valid_get_logs_args({"brief": True, "where": 'topics~"system"', "interval": 1.5})
+    
+    def test_invalid_get_logs_args(self):
+        """Test that wrongly typed arguments are rejected."""
+        assert not is_valid_get_logs_args(None)
+        assert not is_valid_get_logs_args({"brief": "yes"})
+        assert not is_valid_get_logs_args({"where": 1})
+        assert not is_valid_get_logs_args({"interval": True})
+    
+    def test_valid_get_logs_by_condition_args(self):
+        """Test that a condition with correctly typed options is accepted."""
+        assert is_valid_get_logs_by_condition_args({"condition": 'topics~"system"', "brief": True})
+    
+    def test_invalid_get_logs_by_condition_args(self):
+        """Test that a missing condition or wrongly typed option is rejected."""
+        assert not is_valid_get_logs_by_condition_args({"brief": True})
+        assert not is_valid_get_logs_by_condition_args({"condition": 1})
+        assert not is_valid_get_logs_by_condition_args({"condition": "x", "proplist": "time"})
@@ -5,27 +5,29 @@ MCP Protocol Compliance Tests
 These tests verify that the server properly implements the MCP protocol
 without requiring actual server process spawning.
 """
-import os
-import sys
 import pytest
-from unittest.mock import Mock, AsyncMock, patch
+from unittest.mock import Mock
+from mcp.server.lowlevel import NotificationOptions
+from mcp.server.lowlevel.server import request_ctx
+from mcp.types import TextContent
 
-# Ensure project root on sys.path
-PROJECT_ROOT = os.path.dirname(os.path.abspath(os.path.join(__file__, '..')))
-sys.path.insert(0, PROJECT_ROOT)
+from server.server import handle_call_tool, server
 
-pytestmark = pytest.mark.skipif(
-    os.environ.get("RUN_SDK_INTEGRATION") != "1",
-    reason="Set RUN_SDK_INTEGRATION=1 to run MCP protocol compliance tests.",
-)
+# JSON Schema types a tool property may declare
+_VALID_JSON_TYPES = frozenset({"string", "boolean", "number", "integer", "array", "object"})
+
+
+@pytest.fixture
+def no_mikrotik_client():
+    """Run the test inside a request whose lifespan context has no MikroTik client."""
+    token = request_ctx.set(Mock(lifespan_context={"mikrotik_client": None}))
+    yield
+    request_ctx.reset(token)
 
 
 @pytest.mark.asyncio
 async def test_mcp_protocol_compliance():
     """Test that the server properly implements MCP protocol requirements."""
-    from server.server import server
-    from mcp.server.lowlevel import NotificationOptions
-    
     # Test server initialization
     assert server is not None
     assert server.name == "mikrotik-routeros-server"
@@ -47,23 +49,17 @@ async def test_mcp_protocol_compliance():
     
     # Verify resources capability structure
     assert capabilities.resources is not None
-    assert hasattr(capabilities.resources, 'subscribeListChanged')
+    assert hasattr(capabilities.resources, 'listChanged')
     
     # Verify prompts capability structure
     assert capabilities.prompts is not None
 
 
 @pytest.mark.asyncio
-async def test_mcp_primitive_discovery():
+async def test_mcp_primitive_discovery(all_tools, all_resources, all_prompts):
     """Test that the server properly exposes MCP primitives (tools, resources, prompts)."""
-    from server.server import (
-        handle_list_tools, 
-        handle_list_resources, 
-        handle_list_prompts
-    )
-    
     # Test tools discovery
-    tools = await handle_list_tools()
+    tools = all_tools
     assert len(tools) > 0, "Server should expose at least one tool"
     
     # Verify tool structure
@@ -78,7 +74,7 @@ async def test_mcp_primitive_discovery():
         assert tool.inputSchema is not None
     
     # Test resources discovery
-    resources = await handle_list_resources()
+    resources = all_resources
     assert len(resources) > 0, "Server should expose at least one resource"
     
     # Verify resource structure
@@ -95,7 +91,7 @@ async def test_mcp_primitive_discovery():
         assert resource.mimeType is not None
     
     # Test prompts discovery
-    prompts = await handle_list_prompts()
+    prompts = all_prompts
     assert len(prompts) > 0, "Server should expose at least one prompt"
     
     # Verify prompt structure
@@ -103,19 +99,16 @@ async def test_mcp_primitive_discovery():
         assert hasattr(prompt, 'name')
         assert hasattr(prompt, 'title')
         assert hasattr(prompt, 'description')
-        assert hasattr(prompt, 'messages')
+        assert hasattr(prompt, 'arguments')
         assert prompt.name is not None
         assert prompt.title is not None
         assert prompt.description is not None
-        assert prompt.messages is not None
 
 
 @pytest.mark.asyncio
-async def test_mcp_schema_validation():
+async def test_mcp_schema_validation(all_tools):
     """Test that MCP primitives have valid schemas and metadata."""
-    from server.server import handle_list_tools
-    
-    tools = await handle_list_tools()
+    tools = all_tools
     
     for tool in tools:
         schema = tool.inputSchema
@@ -130,29 +123,23 @@ async def test_mcp_schema_validation():
             assert "description" in prop_def, f"Property {prop_name} in {tool.name} missing description"
             
             # Verify type is valid
-            valid_types = ["string", "boolean", "number", "integer", "array", "object"]
-            assert prop_def["type"] in valid_types, f"Property {prop_name} in {tool.name} has invalid type: {prop_def['type']}"
+            assert prop_def["type"] in _VALID_JSON_TYPES, f"Property {prop_name} in {tool.name} has invalid type: {prop_def['type']}"
 
 
 @pytest.mark.asyncio
-async def test_mcp_error_handling():
+async def test_mcp_error_handling(no_mikrotik_client):
     """Test that the server handles errors gracefully according to MCP protocol."""
-    from server.server import handle_call_tool
-    
     # Test tool call with invalid tool name
-    with patch('server.server.mikrotik_client', None):
-        result = await handle_call_tool("invalid_tool", {})
-        
-        # Should return error content
-        assert len(result) > 0
-        assert any(hasattr(content, 'text') for content in result)
-        
-        # Check for error message
-        error_text = "".join(
-            content.text for content in result 
-            if hasattr(content, 'text')
-        )
-        assert "not available" in error_text.lower() or "error" in error_text.lower()
+    result = await handle_call_tool("invalid_tool", {})
+    
+    # Should return error content
+    assert len(result) > 0
+    texts = [content.text for content in result if isinstance(content, TextContent)]
+    assert texts
+    
+    # Check for error message
+    error_text = "".join(texts)
+    assert "not available" in error_text.lower() or "error" in error_text.lower()
 
 
 if __name__ == "__main__":
@@ -4,261 +4,260 @@ Tests for MikroTik System Client
 This module tests the system client functionality including system information,
 resource management, and health monitoring.
 """
-import pytest
-from unittest.mock import Mock, patch, AsyncMock
-import sys
-import os
+from dataclasses import asdict
 
-# Add the project root to the Python path
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root)
+import pytest
+from tests.stubs import async_raise, async_return
 
 from src.mcp_mikrotik.system.client import MikroTikSystemClient
+from src.mcp_mikrotik.system.models import SystemInfo
 
 
-class TestMikroTikSystemClient:
-    """Test cases for MikroTikSystemClient."""
-    
-    @pytest.fixture
-    def client(self):
-        """Create a system client instance for testing."""
-        config = {
-            "host": "192.168.1.1",
-            "username": "admin",
-            "password": "test_password",
-            "port": 443,
-            "useSSL": True
-        }
-        return MikroTikSystemClient(config)
-    
-    @pytest.fixture
-    def sample_system_info(self):
-        """Sample system information for testing."""
-        return {
-            "uptime": "1d 12:00:00",
-            "version": "6.49.7",
-            "board_name": "RB450G",
-            "cpu_count": 4,
-            "cpu_frequency": 600,
-            "cpu_load": 15,
-            "free_hdd_space": 1073741824,
-            "total_hdd_space": 2147483648,
-            "free_memory": 536870912,
-            "total_memory": 1073741824,
-            "architecture_name": "mipsbe",
-            "platform": "MikroTik"
-        }
-    
-    @pytest.mark.asyncio
-    async def test_get_system_info_success(self, client, sample_system_info):
-        """Test successful system info retrieval."""
-        with patch.object(client, '_make_request', return_value=[sample_system_info]):
-            result = await client.get_system_info()
-            assert result == sample_system_info
-    
-    @pytest.mark.asyncio
-    async def test_get_system_info_empty_response(self, client):
-        """Test system info retrieval with empty response."""
-        with patch.object(client, '_make_request', return_value=[]):
-            result = await client.get_system_info()
-            assert result == {}
-    
-    @pytest.mark.asyncio
-    async def test_get_system_info_unexpected_type(self, client):
-        """Test system info retrieval with unexpected response type."""
-        with patch.object(client, '_make_request', return_value="unexpected"):
-            with pytest.raises(TypeError, match="Expected list response"):
-                await client.get_system_info()
-    
-    @pytest.mark.asyncio
-    async def test_get_system_info_request_error(self, client):
-        """Test system info retrieval with request error."""
-        with patch.object(client, '_make_request', side_effect=Exception("Request failed")):
-            with pytest.raises(Exception, match="Request failed"):
-                await client.get_system_info()
-    
-    @pytest.mark.asyncio
-    async def test_get_system_resources_list_response(self, client, sample_system_info):
-        """Test system resources retrieval with list response."""
-        with patch.object(client, '_make_request', return_value=[sample_system_info]):
-            result = await client.get_system_resources()
-            assert result == [sample_system_info]
-    
-    @pytest.mark.asyncio
-    async def test_get_system_resources_dict_response(self, client, sample_system_info):
-        """Test system resources retrieval with dict response containing 'ret' key."""
-        with patch.object(client, '_make_request', return_value={"ret": [sample_system_info]}):
-            result = await client.get_system_resources()
-            assert result == [sample_system_info]
-    
-    @pytest.mark.asyncio
-    async def test_get_system_resources_unexpected_response(self, client):
-        """Test system resources retrieval with unexpected response type."""
-        with patch.object(client, '_make_request', return_value="unexpected"):
-            result = await client.get_system_resources()
-            assert result == []
-    
-    @pytest.mark.asyncio
-    async def test_get_system_resources_request_error(self, client):
-        """Test system resources retrieval with request error."""
-        with patch.object(client, '_make_request', side_effect=Exception("Request failed")):
-            with pytest.raises(Exception, match="Request failed"):
-                await client.get_system_resources()
-    
-    @pytest.mark.asyncio
-    async def test_get_system_health_success(self, client, sample_system_info):
-        """Test successful system health retrieval."""
-        with patch.object(client, 'get_system_info', return_value=sample_system_info):
-            result = await client.get_system_health()
-            
-            assert result["status"] == "healthy"
-            assert result["uptime"] == "1d 12:00:00"
-            assert result["version"] == "6.49.7"
-            assert result["cpu_load"] == 15
-            assert result["memory_usage_percent"] == 50.0
-            assert result["disk_usage_percent"] == 50.0
-            assert result["free_memory_mb"] == 512.0
-            assert result["free_disk_mb"] == 1024.0
-    
-    @pytest.mark.asyncio
-    async def test_get_system_health_critical_memory(self, client):
-        """Test system health with critical memory usage."""
-        system_info = {
-            "total_memory": 1000000000,
-            "free_memory": 50000000,  # 5% free memory
-            "total_hdd_space": 2000000000,
-            "free_hdd_space": 1000000000  # 50% free disk
-        }
-        
-        with patch.object(client, 'get_system_info', return_value=system_info):
-            result = await client.get_system_health()
-            assert result["status"] == "critical"
-            assert result["memory_usage_percent"] == 95.0
-    
-    @pytest.mark.asyncio
-    async def test_get_system_health_critical_disk(self, client):
-        """Test system health with critical disk usage."""
-        system_info = {
-            "total_memory": 1000000000,
-            "free_memory": 500000000,  # 50% free memory
-            "total_hdd_space": 2000000000,
-            "free_hdd_space": 100000000  # 5% free disk
-        }
-        
-        with patch.object(client, 'get_system_info', return_value=system_info):
-            result = await client.get_system_health()
-            assert result["status"] == "critical"
-            assert result["disk_usage_percent"] == 95.0
-    
-    @pytest.mark.asyncio
-    async def test_get_system_health_warning(self, client):
-        """Test system health with warning status."""
-        system_info = {
-            "total_memory": 1000000000,
-            "free_memory": 150000000,  # 15% free memory
-            "total_hdd_space": 2000000000,
-            "free_hdd_space": 300000000  # 15% free disk
-        }
-        
-        with patch.object(client, 'get_system_info', return_value=system_info):
-            result = await client.get_system_health()
-            assert result["status"] == "warning"
-            assert result["memory_usage_percent"] == 85.0
-            assert result["disk_usage_percent"] == 85.0
+# Sample /system/resource entry; tests only read it, so one copy is shared
+_SAMPLE_SYSTEM_INFO = {
+    "uptime": "1d 12:00:00",
+    "version": "6.49.7",
+    "board_name": "RB450G",
+    "cpu_count": 4,
+    "cpu_frequency": 600,
+    "cpu_load": 15,
+    "free_hdd_space": 1073741824,
+    "total_hdd_space": 2147483648,
+    "free_memory": 536870912,
+    "total_memory": 1073741824,
+    "architecture_name": "mipsbe",
+    "platform": "MikroTik"
+}
+
+
+def _usage_info(free_memory, free_hdd_space):
+    """Build system info with 1 GB total memory and 2 GB total disk."""
+    return {
+        "total_memory": 1000000000,
+        "free_memory": free_memory,
+        "total_hdd_space": 2000000000,
+        "free_hdd_space": free_hdd_space
+    }
+
+
+# Function scoped: the client caches /system/resource responses
+# (see test_system_resource_response_is_cached)
+@pytest.fixture
+def client(mikrotik_config):
+    """Create a system client instance for testing."""
+    return MikroTikSystemClient(mikrotik_config)
+
+
+@pytest.fixture(scope="module")
+def sample_system_info():
+    """Sample system information for testing."""
+    return _SAMPLE_SYSTEM_INFO
+
+
+@pytest.fixture
+def stub_system_info(client, sample_system_info, request):
+    """Make get_system_info return the indirectly parametrized dict (default: the sample)."""
+    system_info = getattr(request, "param", sample_system_info)
+    client.get_system_info = async_return(system_info)
+    return system_info
+
+
+async def test_get_system_info_success(client, sample_system_info):
+    """Test successful system info retrieval."""
+    client._make_request = async_return([sample_system_info])
+    result = await client.get_system_info()
+    assert result == sample_system_info
+
+
+async def test_get_system_info_empty_response(client):
+    """Test system info retrieval with empty response."""
+    client._make_request = async_return([])
+    result = await client.get_system_info()
+    assert result == {}
+
+
+async def test_get_system_info_unexpected_type(client):
+    """Test system info retrieval with unexpected response type."""
+    client._make_request = async_return("unexpected")
+    with pytest.raises(TypeError, match="Expected list response"):
+        await client.get_system_info()
+
+
+async def test_system_resource_response_is_cached(client, sample_system_info, async_mock):
+    """Test that back-to-back calls share one /system/resource request."""
+    async_mock.return_value = [sample_system_info]
+    client._make_request = async_mock
+    await client.get_system_info()
+    await client.get_system_resources()
+    await client.get_system_health()
     
-    @pytest.mark.asyncio
-    async def test_get_system_health_attention(self, client):
-        """Test system health with attention status."""
-        system_info = {
-            "total_memory": 1000000000,
-            "free_memory": 250000000,  # 25% free memory
-            "total_hdd_space": 2000000000,
-            "free_hdd_space": 500000000  # 25% free disk
-        }
-        
-        with patch.object(client, 'get_system_info', return_value=system_info):
-            result = await client.get_system_health()
-            assert result["status"] == "attention"
-            assert result["memory_usage_percent"] == 75.0
-            assert result["disk_usage_percent"] == 75.0
+    async_mock.assert_called_once_with('POST', '/system/resource/print', {})
+
+
+async def test_get_system_resources_list_response(client, sample_system_info):
+    """Test system resources retrieval with list response."""
+    client._make_request = async_return([sample_system_info])
+    result = await client.get_system_resources()
+    assert result == [sample_system_info]
+
+
+async def test_get_system_resources_dict_response(client, sample_system_info):
+    """Test system resources retrieval with dict response containing 'ret' key."""
+    client._make_request = async_return({"ret": [sample_system_info]})
+    result = await client.get_system_resources()
+    assert result == [sample_system_info]
+
+
+async def test_get_system_resources_unexpected_response(client):
+    """Test system resources retrieval with unexpected response type."""
+    client._make_request = async_return("unexpected")
+    result = await client.get_system_resources()
+    assert result == []
+
+
+@pytest.mark.parametrize("method_name", ["get_system_info", "get_system_resources"])
+async def test_request_error_propagates(client, method_name):
+    """Test that request errors propagate from system info and resources retrieval."""
+    client._make_request = async_raise(Exception("Request failed"))
+    with pytest.raises(Exception, match="Request failed"):
+        await getattr(client, method_name)()
+
+
+async def test_get_system_health_success(client, stub_system_info):
+    """Test successful system health retrieval."""
+    result = await client.get_system_health()
     
-    @pytest.mark.asyncio
-    async def test_get_system_health_no_system_info(self, client):
-        """Test system health retrieval with no system information."""
-        with patch.object(client, 'get_system_info', return_value={}):
-            result = await client.get_system_health()
-            assert result["status"] == "unknown"
-            assert "error" in result
+    assert result == {
+        "status": "healthy",
+        "uptime": "1d 12:00:00",
+        "version": "6.49.7",
+        "cpu_load": 15,
+        "memory_usage_percent": 50.0,
+        "disk_usage_percent": 50.0,
+        "free_memory_mb": 512.0,
+        "free_disk_mb": 1024.0
+    }
+
+
+@pytest.mark.parametrize("stub_system_info, status, memory_usage, disk_usage", [
+    (_usage_info(50000000, 1000000000), "critical", 95.0, 50.0),
+    (_usage_info(500000000, 100000000), "critical", 50.0, 95.0),
+    (_usage_info(150000000, 300000000), "warning", 85.0, 85.0),
+    (_usage_info(250000000, 500000000), "attention", 75.0, 75.0),
+    (_usage_info(500000000, 1000000000), "healthy", 50.0, 50.0),
+], indirect=["stub_system_info"], ids=["critical-memory", "critical-disk", "warning", "attention", "healthy"])
+async def test_get_system_health_thresholds(client, stub_system_info, status, memory_usage, disk_usage):
+    """Test system health status and usage percentages across the thresholds."""
+    result = await client.get_system_health()
+    assert result["status"] == status
+    assert result["memory_usage_percent"] == memory_usage
+    assert result["disk_usage_percent"] == disk_usage
+
+
+@pytest.mark.parametrize("stub_system_info", [{}], indirect=True)
+async def test_get_system_health_no_system_info(client, stub_system_info):
+    """Test system health retrieval with no system information."""
+    result = await client.get_system_health()
+    assert result["status"] == "unknown"
+    assert "error" in result
+
+
+@pytest.mark.parametrize("stub_system_info", [{
+    "uptime": "1d 12:00:00",
+    "version": "6.49.7"
+    # Missing memory and disk information
+}], indirect=True)
+async def test_get_system_health_missing_memory_info(client, stub_system_info):
+    """Test system health retrieval with missing memory information."""
+    result = await client.get_system_health()
+    assert result["status"] == "healthy"
+    assert result["memory_usage_percent"] == 0.0
+    assert result["disk_usage_percent"] == 0.0
+    assert result["free_memory_mb"] == 0.0
+    assert result["free_disk_mb"] == 0.0
+
+
+async def test_get_system_health_exception_handling(client):
+    """Test system health retrieval with exception handling."""
+    client.get_system_info = async_raise(Exception("System error"))
+    result = await client.get_system_health()
+    assert result["status"] == "error"
+    assert result["error"] == "System error"
+
+
+def test_memory_calculation_accuracy():
+    """Test memory usage calculation accuracy."""
+    # Test with exact values
+    total_memory = 1000000000  # 1GB
+    free_memory = 250000000    # 250MB
     
-    @pytest.mark.asyncio
-    async def test_get_system_health_missing_memory_info(self, client):
-        """Test system health retrieval with missing memory information."""
-        system_info = {
-            "uptime": "1d 12:00:00",
-            "version": "6.49.7"
-            # Missing memory and disk information
-        }
-        
-        with patch.object(client, 'get_system_info', return_value=system_info):
-            result = await client.get_system_health()
-            assert result["status"] == "healthy"
-            assert result["memory_usage_percent"] == 0.0
-            assert result["disk_usage_percent"] == 0.0
-            assert result["free_memory_mb"] == 0.0
-            assert result["free_disk_mb"] == 0.0
+    # Calculate expected usage
+    expected_usage = ((total_memory - free_memory) / total_memory) * 100
     
-    @pytest.mark.asyncio
-    async def test_get_system_health_exception_handling(self, client):
-        """Test system health retrieval with exception handling."""
-        with patch.object(client, 'get_system_info', side_effect=Exception("System error")):
-            result = await client.get_system_health()
-            assert result["status"] == "error"
-            assert result["error"] == "System error"
+    # This should be exactly 75.0%
+    assert expected_usage == 75.0
+
+
+def test_disk_calculation_accuracy():
+    """Test disk usage calculation accuracy."""
+    # Test with exact values
+    total_disk = 2000000000  # 2GB
+    free_disk = 500000000    # 500MB
     
-    def test_memory_calculation_accuracy(self, client):
-        """Test memory usage calculation accuracy."""
-        # Test with exact values
-        total_memory = 1000000000  # 1GB
-        free_memory = 250000000    # 250MB
-        
-        # Calculate expected usage
-        expected_usage = ((total_memory - free_memory) / total_memory) * 100
-        
-        # This should be exactly 75.0%
-        assert expected_usage == 75.0
+    # Calculate expected usage
+    expected_usage = ((total_disk - free_disk) / total_disk) * 100
     
-    def test_disk_calculation_accuracy(self, client):
-        """Test disk usage calculation accuracy."""
-        # Test with exact values
-        total_disk = 2000000000  # 2GB
-        free_disk = 500000000    # 500MB
-        
-        # Calculate expected usage
-        expected_usage = ((total_disk - free_disk) / total_disk) * 100
-        
-        # This should be exactly 75.0%
-        assert expected_usage == 75.0
+    # This should be exactly 75.0%
+    assert expected_usage == 75.0
+
+
+@pytest.mark.parametrize("total_memory, free_memory, usage, status", [
+    (1000, 300, 70.0, "healthy"),
+    (735, 147, 80.0, "attention"),
+    (1405, 281, 80.0, "attention"),
+    (1470, 294, 80.0, "attention"),
+    (1190, 119, 90.0, "warning"),
+])
+async def test_get_system_health_exactly_at_threshold(client, total_memory, free_memory, usage, status):
+    """Test that usage computing to exactly a threshold keeps the lower status."""
+    client.get_system_info = async_return({"total_memory": total_memory, "free_memory": free_memory})
+    result = await client.get_system_health()
+    assert result["memory_usage_percent"] == usage
+    assert result["status"] == status
+
+
+def test_determine_health_status_thresholds():
+    """Test that usage exactly at a threshold keeps the lower status."""
+    assert MikroTikSystemClient._determine_health_status(70.0, 0.0) == "healthy"
+    assert MikroTikSystemClient._determine_health_status(0.0, 80.0) == "attention"
+    assert MikroTikSystemClient._determine_health_status(90.0, 90.0) == "warning"
+    assert MikroTikSystemClient._determine_health_status(90.01, 0.0) == "critical"
+
+
+def test_memory_conversion_to_mb():
+    """Test memory conversion from bytes to MB."""
+    bytes_value = 1073741824  # 1GB in bytes
+    mb_value = bytes_value / (1024 * 1024)
     
-    def test_health_status_thresholds(self, client):
-        """Test health status threshold logic."""
-        # Test healthy status (all below 70%)
-        assert client._determine_health_status(65.0, 60.0) == "healthy"
-        
-        # Test attention status (one above 70%)
-        assert client._determine_health_status(75.0, 60.0) == "attention"
-        assert client._determine_health_status(60.0, 75.0) == "attention"
-        
-        # Test warning status (one above 80%)
-        assert client._determine_health_status(85.0, 60.0) == "warning"
-        assert client._determine_health_status(60.0, 85.0) == "warning"
-        
-        # Test critical status (one above 90%)
-        assert client._determine_health_status(95.0, 60.0) == "critical"
-        assert client._determine_health_status(60.0, 95.0) == "critical"
+    assert mb_value == 1024.0  # 1GB = 1024MB
+
+
+def test_system_info_from_dict(sample_system_info):
+    """Test that SystemInfo keeps the known fields and drops unknown keys."""
+    info = SystemInfo.from_dict({**sample_system_info, "bad-blocks": "0%"})
     
-    def test_memory_conversion_to_mb(self, client):
-        """Test memory conversion from bytes to MB."""
-        bytes_value = 1073741824  # 1GB in bytes
-        mb_value = bytes_value / (1024 * 1024)
-        
-        assert mb_value == 1024.0  # 1GB = 1024MB
+    assert info.total_memory == 1073741824
+    assert asdict(info) == sample_system_info
+
+@pytest.mark.parametrize("memory_usage, disk_usage, expected", [
+    (65.0, 60.0, "healthy"),
+    (75.0, 60.0, "attention"),
+    (60.0, 75.0, "attention"),
+    (85.0, 60.0, "warning"),
+    (60.0, 85.0, "warning"),
+    (95.0, 60.0, "critical"),
+    (60.0, 95.0, "critical"),
+])
+def test_health_status_thresholds(memory_usage, disk_usage, expected):
+    """Test that the higher of memory and disk usage picks the health status."""
+    assert MikroTikSystemClient._determine_health_status(memory_usage, disk_usage) == expected